@@ -10,14 +10,15 @@ This add-in processes JSON manufacturing orders to:
 
 import adsk.core
 import adsk.fusion
-import traceback
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+# Add src directory to path for imports
+_src_path = os.path.dirname(__file__)
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
 
-from src import app
+import app
 
 # Global references to maintain command handlers
 _app = None
@@ -41,14 +42,9 @@ def run(context):
         # Register the command
         app.register_command(_ui, _handlers)
         
-        _ui.messageBox(
-            'Fusion Manufacturing Pipeline loaded successfully.\n\n'
-            'Look for "Run Order" in the TOOLS tab > ADD-INS panel.',
-            'Manufacturing Pipeline'
-        )
-        
     except:
         if _ui:
+            import traceback
             _ui.messageBox('Failed to initialize add-in:\n{}'.format(traceback.format_exc()))
 
 
@@ -76,4 +72,5 @@ def stop(context):
         
     except:
         if _ui:
+            import traceback
             _ui.messageBox('Failed to clean up add-in:\n{}'.format(traceback.format_exc()))
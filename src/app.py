@@ -5,8 +5,8 @@ Handles command registration and coordination.
 
 import adsk.core
 import adsk.fusion
-import traceback
 import os
+import functools
 from pathlib import Path
 
 from command_handler import RunOrderCommandHandler
@@ -21,6 +21,47 @@ COMMAND_TOOLTIP = 'Load and process a JSON manufacturing order'
 WORKSPACE_ID = 'FusionSolidEnvironment'
 PANEL_ID = 'SolidCreatePanel'  # The SOLID panel in DESIGN tab
 
+# Known IDs of the CREATE dropdown, tried before scanning every panel control
+CREATE_DROPDOWN_IDS = ('SolidCreatePanelDropdown', 'CreatePanelDropdown')
+
+# ID of the dropdown the command was added to (None = added directly to panel)
+_create_dropdown_id = None
+
+
+def find_create_dropdown(panel: adsk.core.ToolbarPanel):
+    """
+    Find the CREATE dropdown in a toolbar panel.
+    Tries the known dropdown IDs first and only scans every control as a fallback.
+    
+    Args:
+        panel: Toolbar panel to search
+        
+    Returns:
+        DropDownControl or None if not found
+    """
+    global _create_dropdown_id
+    
+    controls = panel.controls
+    candidates = CREATE_DROPDOWN_IDS
+    if _create_dropdown_id:
+        candidates = (_create_dropdown_id,) + candidates
+    
+    for dropdown_id in candidates:
+        dropdown_ctrl = adsk.core.DropDownControl.cast(controls.itemById(dropdown_id))
+        if dropdown_ctrl:
+            _create_dropdown_id = dropdown_id
+            return dropdown_ctrl
+    
+    for ctrl in controls:
+        if ctrl.objectType == adsk.core.DropDownControl.classType():
+            dropdown_ctrl = adsk.core.DropDownControl.cast(ctrl)
+            # Look for any dropdown with 'create' in the name
+            if 'create' in dropdown_ctrl.id.lower():
+                _create_dropdown_id = dropdown_ctrl.id
+                return dropdown_ctrl
+    
+    return None
+
 
 def register_command(ui: adsk.core.UserInterface, handlers: list):
     """
@@ -64,14 +105,7 @@ def register_command(ui: adsk.core.UserInterface, handlers: list):
         handlers.append(handler)
         
         # Find the CREATE dropdown in the SOLID panel (PCB Create dropdown)
-        create_dropdown = None
-        for ctrl in panel.controls:
-            if ctrl.objectType == adsk.core.DropDownControl.classType():
-                dropdown_ctrl = adsk.core.DropDownControl.cast(ctrl)
-                # Look for any dropdown with 'create' in the name
-                if 'create' in dropdown_ctrl.id.lower():
-                    create_dropdown = dropdown_ctrl
-                    break
+        create_dropdown = find_create_dropdown(panel)
         
         if create_dropdown:
             # Add to CREATE dropdown
@@ -85,6 +119,7 @@ def register_command(ui: adsk.core.UserInterface, handlers: list):
                 panel.controls.addCommand(cmd_def)
         
     except:
+        import traceback
         ui.messageBox(f'Failed to register command:\n{traceback.format_exc()}')
 
 
@@ -101,8 +136,14 @@ def unregister_command(ui: adsk.core.UserInterface):
         if workspace:
             panel = workspace.toolbarPanels.itemById(PANEL_ID)
             if panel:
-                # Remove control from panel
-                control = panel.controls.itemById(COMMAND_ID)
+                # Remove control from the CREATE dropdown it was added to, or the panel
+                controls = panel.controls
+                if _create_dropdown_id:
+                    dropdown_ctrl = adsk.core.DropDownControl.cast(controls.itemById(_create_dropdown_id))
+                    if dropdown_ctrl:
+                        controls = dropdown_ctrl.controls
+                
+                control = controls.itemById(COMMAND_ID)
                 if control:
                     control.deleteMe()
         
@@ -112,9 +153,11 @@ def unregister_command(ui: adsk.core.UserInterface):
             cmd_def.deleteMe()
             
     except:
+        import traceback
         ui.messageBox(f'Failed to unregister command:\n{traceback.format_exc()}')
 
 
+@functools.lru_cache(maxsize=None)
 def get_repo_root() -> Path:
     """
     Get the repository root directory.
@@ -126,6 +169,7 @@ def get_repo_root() -> Path:
     return Path(__file__).parent.parent
 
 
+@functools.lru_cache(maxsize=None)
 def get_schema_path() -> Path:
     """
     Get path to schema.json.
@@ -136,9 +180,11 @@ def get_schema_path() -> Path:
     return get_repo_root() / 'schema.json'
 
 
+@functools.lru_cache(maxsize=None)
 def get_log_directory() -> Path:
     """
     Get or create log directory.
+    Created on first call; later calls return the cached path.
     
     Returns:
         Path object pointing to logs directory
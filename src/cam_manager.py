@@ -6,7 +6,41 @@ Handles CAM workspace operations and toolpath regeneration
 import adsk.core
 import adsk.fusion
 import adsk.cam
-from typing import List, Tuple, Optional
+import time
+from typing import Dict, List, NamedTuple, Tuple, Optional
+
+# Seconds to sleep between polls while waiting for toolpath generation
+GENERATION_POLL_INTERVAL = 0.01
+
+# Operation error property is not exposed by every Fusion version;
+# probe the class once at import instead of each operation in the hot loop
+_HAS_ERROR = hasattr(adsk.cam.Operation, 'error')
+
+# Show intermediate progress dialogs (modal - blocks the pipeline until dismissed)
+SHOW_PROGRESS_DIALOGS = False
+
+
+class _OperationSnapshot(NamedTuple):
+    """Operation state read once after generation, so classification makes no Fusion calls"""
+    suppressed: bool
+    has_toolpath: bool
+    error: str
+
+
+def _snapshot_operation(operation: adsk.cam.Operation) -> _OperationSnapshot:
+    """Read the state needed to classify an operation, one property access each."""
+    suppressed, has_toolpath = operation.isSuppressed, operation.hasToolpath
+    
+    # Error text only matters for active operations that produced no toolpath
+    error_text = ''
+    if _HAS_ERROR and not suppressed and not has_toolpath:
+        try:
+            error = operation.error
+            error_text = str(error).strip() if error else ''
+        except RuntimeError:
+            pass
+    
+    return _OperationSnapshot(suppressed, has_toolpath, error_text)
 
 
 class CAMManager:
@@ -24,6 +58,12 @@ class CAMManager:
         self.ui = app.userInterface
         self.document = document
         self.cam_product = None
+        self._cam = None
+        self._setups_snapshot = None
+        
+        # Setup name -> Setup lookup, rebuilt when the document version changes
+        self._setup_index: Optional[Dict[str, adsk.cam.Setup]] = None
+        self._setup_index_doc_rev = None
     
     def get_cam_product(self) -> Tuple[bool, str]:
         """
@@ -40,6 +80,12 @@ class CAMManager:
             if not self.cam_product:
                 return False, 'No CAM data found in document. Please create CAM setups first in MANUFACTURE workspace.'
             
+            self._cam = adsk.cam.CAM.cast(self.cam_product)
+            if not self._cam:
+                return False, 'Could not access CAM data'
+            
+            self.invalidate()
+            
             return True, 'CAM product accessed'
             
         except Exception as e:
@@ -52,22 +98,26 @@ class CAMManager:
         Returns:
             List of CAM Setup objects
         """
-        try:
-            if not self.cam_product:
-                return []
-            
-            cam = adsk.cam.CAM.cast(self.cam_product)
-            if not cam:
-                return []
-            
-            setups = []
-            for setup in cam.setups:
-                setups.append(setup)
-            
-            return setups
-            
-        except:
+        if not self._cam:
             return []
+        
+        if self._setups_snapshot is None:
+            try:
+                self._setups_snapshot = list(self._cam.setups)
+            except RuntimeError:
+                # Fusion API failures surface as RuntimeError
+                return []
+        
+        return list(self._setups_snapshot)
+    
+    def invalidate(self):
+        """
+        Drop cached setups so the next lookup re-reads them from the CAM product.
+        Call after setups are added, removed or renamed.
+        """
+        self._setups_snapshot = None
+        self._setup_index = None
+        self._setup_index_doc_rev = None
     
     def get_setup_by_name(self, setup_name: str) -> Optional[adsk.cam.Setup]:
         """
@@ -79,22 +129,7 @@ class CAMManager:
         Returns:
             Setup object or None if not found
         """
-        try:
-            if not self.cam_product:
-                return None
-            
-            cam = adsk.cam.CAM.cast(self.cam_product)
-            if not cam:
-                return None
-            
-            for setup in cam.setups:
-                if setup.name == setup_name:
-                    return setup
-            
-            return None
-            
-        except:
-            return None
+        return self._get_setup_index().get(setup_name)
     
     def list_setup_names(self) -> List[str]:
         """
@@ -103,8 +138,37 @@ class CAMManager:
         Returns:
             List of setup names
         """
-        setups = self.get_all_setups()
-        return [setup.name for setup in setups]
+        return list(self._get_setup_index(check_revision=True))
+    
+    def _get_document_revision(self) -> Optional[int]:
+        """Get the document version number, or None for unsaved documents."""
+        data_file = self.document.dataFile
+        return data_file.versionNumber if data_file else None
+    
+    def _build_setup_index(self):
+        """Rebuild the setup name -> Setup lookup from a single pass over cam.setups."""
+        self._setup_index = {setup.name: setup for setup in self.get_all_setups()}
+        self._setup_index_doc_rev = self._get_document_revision()
+    
+    def _get_setup_index(self, check_revision: bool = False) -> Dict[str, adsk.cam.Setup]:
+        """
+        Get the setup name -> Setup lookup, building it on first use.
+        
+        Args:
+            check_revision: Also rebuild if the document version changed. Costs two
+                Fusion calls, so it is done once per batch operation, not per lookup.
+        
+        Returns:
+            Dictionary mapping setup name to Setup object
+        """
+        if not self._cam:
+            return {}
+        
+        if self._setup_index is None or (check_revision and self._get_document_revision() != self._setup_index_doc_rev):
+            self._setups_snapshot = None
+            self._build_setup_index()
+        
+        return self._setup_index
     
     def regenerate_all_toolpaths(self) -> Tuple[bool, str, List[Tuple[str, bool, str]]]:
         """
@@ -115,145 +179,141 @@ class CAMManager:
             Tuple of (success: bool, message: str, results: List[(setup_name, success, message)])
         """
         try:
-            if not self.cam_product:
-                return False, 'CAM product not initialized', []
-            
-            cam = adsk.cam.CAM.cast(self.cam_product)
-            if not cam:
-                return False, 'Could not access CAM data', []
-            
-            # Get all setups
-            setups = self.get_all_setups()
-            
-            if not setups:
-                return False, 'No CAM setups found in document', []
+            started, message, future, setup_snapshots = self._start_generation()
+            if not started:
+                return False, message, []
             
-            results = []
-            all_success = True
-            
-            # Generate all toolpaths at once
             try:
-                self.ui.messageBox(
-                    f'Regenerating toolpaths for {len(setups)} setup(s):\n  • ' + '\n  • '.join([s.name for s in setups]),
-                    'Generating Toolpaths',
-                    adsk.core.MessageBoxButtonTypes.OKButtonType,
-                    adsk.core.MessageBoxIconTypes.InformationIconType
-                )
-                
-                # Use generateAllToolpaths on the entire CAM object
-                # Parameter: False = regenerate ALL toolpaths (don't skip any)
-                # This ensures toolpaths update after parameter changes
-                # We handle errors gracefully below rather than skipping operations
-                future = cam.generateAllToolpaths(False)  # False = regenerate all
-                
-                # Wait for completion
+                # Wait for completion, yielding to the UI without spinning a core
                 while not future.isGenerationCompleted:
                     adsk.doEvents()
+                    time.sleep(GENERATION_POLL_INTERVAL)
+                
+                return self._collect_generation_results(setup_snapshots)
                 
-                # Check if generation completed
-                if not future.isGenerationCompleted:
-                    for setup in setups:
-                        results.append((setup.name, False, 'Generation did not complete'))
-                    all_success = False
-                else:
-                    # Generation completed - now verify each setup's operations
-                    for setup in setups:
-                        setup_name = setup.name
-                        
-                        # Check all operations in this setup for errors
-                        has_errors = False
-                        error_messages = []
-                        warning_messages = []
-                        
-                        operations_with_toolpaths = 0
-                        operations_total = 0
-                        
-                        for operation in setup.allOperations:
-                            op_name = operation.name
-                            operations_total += 1
-                            
-                            # Check if operation is suppressed (skip it)
-                            if operation.isSuppressed:
-                                warning_messages.append(f"'{op_name}' is suppressed (skipped)")
-                                continue
-                            
-                            # Check if operation has a toolpath
-                            if operation.hasToolpath:
-                                operations_with_toolpaths += 1
-                            else:
-                                # No toolpath - check if it's due to pre-existing error
-                                has_preexisting_error = False
-                                
-                                # Check for errors
-                                try:
-                                    if hasattr(operation, 'error') and operation.error:
-                                        error_text = str(operation.error)
-                                        if error_text and error_text.strip():
-                                            # Pre-existing CAM error
-                                            warning_messages.append(f"'{op_name}' (pre-existing error)")
-                                            has_preexisting_error = True
-                                except:
-                                    pass
-                                
-                                if not has_preexisting_error:
-                                    # No error info, just no toolpath
-                                    warning_messages.append(f"'{op_name}' (no toolpath generated)")
-                            
-                            # Check for warnings
-                            try:
-                                if hasattr(operation, 'warning') and operation.warning:
-                                    warning_text = str(operation.warning)
-                                    if warning_text and warning_text.strip():
-                                        warning_messages.append(f"'{op_name}': {warning_text}")
-                            except:
-                                pass
-                        
-                        # Build result message
-                        # Consider it success if:
-                        # 1. At least one operation generated successfully, OR
-                        # 2. All operations that failed have pre-existing errors (not our fault)
-                        
-                        if operations_with_toolpaths > 0:
-                            # At least some operations succeeded
-                            msg = f'Regenerated {operations_with_toolpaths}/{operations_total} toolpaths'
-                            
-                            # Add brief warning summary
-                            if warning_messages:
-                                failed_count = operations_total - operations_with_toolpaths
-                                if failed_count > 0:
-                                    msg += f' ({failed_count} operation(s) have errors - not regenerated)'
-                            
-                            results.append((setup_name, True, msg))
-                        else:
-                            # No operations generated - check if they all have pre-existing errors
-                            # If so, it's a warning not a failure
-                            if operations_total > 0 and len(warning_messages) >= operations_total:
-                                # All operations have errors - log as warning
-                                msg = f'All {operations_total} operation(s) have errors - none regenerated'
-                                results.append((setup_name, True, msg))
-                            else:
-                                # Unexpected failure
-                                msg = f'No operations regenerated ({operations_total} total)'
-                                results.append((setup_name, False, msg))
-                                all_success = False
-                        
             except Exception as e:
-                for setup in setups:
-                    results.append((setup.name, False, f'Exception: {str(e)}'))
-                all_success = False
-            
-            # Build summary message
-            if all_success:
-                message = f'All toolpaths regenerated successfully for {len(setups)} setup(s)'
-            else:
-                failed = [r[0] for r in results if not r[1]]
-                message = f'Toolpath regeneration failed for setup(s): {", ".join(failed)}'
-            
-            return all_success, message, results
+                results = [(setup_name, False, f'Exception: {str(e)}') for setup_name, _ in setup_snapshots]
+                return False, self._summarize_generation(results), results
             
         except Exception as e:
             return False, f'Failed to regenerate toolpaths: {str(e)}', []
     
+    def _start_generation(self):
+        """
+        Kick off generateAllToolpaths and snapshot the setups while it runs.
+        
+        Returns:
+            Tuple of (started: bool, message: str, future, setup_snapshots: List[(setup_name, operations)])
+        """
+        if not self._cam:
+            return False, 'CAM product not initialized', None, []
+        
+        # Get all setups
+        setups = self.get_all_setups()
+        
+        if not setups:
+            return False, 'No CAM setups found in document', None, []
+        
+        if SHOW_PROGRESS_DIALOGS:
+            self.ui.messageBox(
+                f'Regenerating toolpaths for {len(setups)} setup(s):\n  • ' + '\n  • '.join([s.name for s in setups]),
+                'Generating Toolpaths',
+                adsk.core.MessageBoxButtonTypes.OKButtonType,
+                adsk.core.MessageBoxIconTypes.InformationIconType
+            )
+        
+        # Use generateAllToolpaths on the entire CAM object
+        # Parameter: False = regenerate ALL toolpaths (don't skip any)
+        # This ensures toolpaths update after parameter changes
+        # We handle errors gracefully below rather than skipping operations
+        future = self._cam.generateAllToolpaths(False)  # False = regenerate all
+        
+        # Snapshot setup names and operation lists while generation runs,
+        # so the verification pass only reads per-operation state
+        setup_snapshots = [(setup.name, list(setup.allOperations)) for setup in setups]
+        
+        return True, 'Generation started', future, setup_snapshots
+    
+    def _collect_generation_results(self, setup_snapshots) -> Tuple[bool, str, List[Tuple[str, bool, str]]]:
+        """
+        Verify each setup's operations after generation has finished.
+        
+        Args:
+            setup_snapshots: List of (setup_name, operations) taken at kickoff
+            
+        Returns:
+            Tuple of (success: bool, message: str, results: List[(setup_name, success, message)])
+        """
+        results = []
+        
+        # Generation completed - now verify each setup's operations
+        for setup_name, operations in setup_snapshots:
+            success, msg = self._verify_setup_operations([_snapshot_operation(op) for op in operations])
+            results.append((setup_name, success, msg))
+        
+        all_success = all(success for _, success, _ in results)
+        return all_success, self._summarize_generation(results), results
+    
+    def _verify_setup_operations(self, operations: List[_OperationSnapshot]) -> Tuple[bool, str]:
+        """
+        Check one setup's operations for generated toolpaths.
+        
+        Args:
+            operations: Snapshots of the setup's operations
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        operations_with_toolpaths = 0
+        operations_total = 0
+        n_suppressed = 0
+        n_preexisting_err = 0
+        
+        for op in operations:
+            operations_total += 1
+            
+            # Check if operation is suppressed (skip it)
+            if op.suppressed:
+                n_suppressed += 1
+            # Check if operation has a toolpath
+            elif op.has_toolpath:
+                operations_with_toolpaths += 1
+            # No toolpath - check if it's due to pre-existing error
+            elif op.error:
+                n_preexisting_err += 1
+        
+        # Build result message
+        # Consider it success if:
+        # 1. At least one operation generated successfully, OR
+        # 2. All operations that failed have pre-existing errors (not our fault)
+        
+        if operations_with_toolpaths > 0:
+            # At least some operations succeeded
+            msg = f'Regenerated {operations_with_toolpaths}/{operations_total} toolpaths'
+            
+            # Add brief warning summary
+            failed_count = operations_total - operations_with_toolpaths
+            if failed_count > 0:
+                msg += f' ({failed_count} operation(s) have errors - not regenerated)'
+            
+            return True, msg
+        
+        # No operations generated - check if they all have pre-existing errors
+        # If so, it's a warning not a failure
+        if operations_total > 0 and n_preexisting_err + n_suppressed == operations_total:
+            # All operations have errors - log as warning
+            return True, f'All {operations_total} operation(s) have errors - none regenerated'
+        
+        # Unexpected failure
+        return False, f'No operations regenerated ({operations_total} total)'
+    
+    def _summarize_generation(self, results: List[Tuple[str, bool, str]]) -> str:
+        """Build the summary message for a set of per-setup results."""
+        failed = [r[0] for r in results if not r[1]]
+        if not failed:
+            return f'All toolpaths regenerated successfully for {len(results)} setup(s)'
+        return f'Toolpath regeneration failed for setup(s): {", ".join(failed)}'
+    
     def regenerate_specific_setups(self, setup_names: List[str]) -> Tuple[bool, str, List[Tuple[str, bool, str]]]:
         """
         Regenerate toolpaths for specific setups only.
@@ -265,58 +325,36 @@ class CAMManager:
             Tuple of (success: bool, message: str, results: List[(setup_name, success, message)])
         """
         try:
-            if not self.cam_product:
+            if not self._cam:
                 return False, 'CAM product not initialized', []
             
-            cam = adsk.cam.CAM.cast(self.cam_product)
-            if not cam:
-                return False, 'Could not access CAM data', []
-            
-            results = []
-            all_success = True
+            cam = self._cam
             
             # Validate all setups exist first
-            available_setups = self.list_setup_names()
-            missing = [name for name in setup_names if name not in available_setups]
+            setup_index = self._get_setup_index(check_revision=True)
+            missing = [name for name in setup_names if name not in setup_index]
             
             if missing:
-                return False, f'Setup(s) not found: {", ".join(missing)}. Available: {", ".join(available_setups)}', []
+                return False, f'Setup(s) not found: {", ".join(missing)}. Available: {", ".join(setup_index)}', []
             
-            # Regenerate specified setups
-            for setup_name in setup_names:
-                setup = self.get_setup_by_name(setup_name)
+            try:
+                # Fusion doesn't have a per-setup generation method in the API, so
+                # generate once with generateAllToolpaths, then verify each
+                # requested setup's operations
+                future = cam.generateAllToolpaths(False)
                 
-                if not setup:
-                    results.append((setup_name, False, 'Setup not found'))
-                    all_success = False
-                    continue
+                # Snapshot the requested setups' operations while generation runs
+                setup_snapshots = [(name, list(setup_index[name].allOperations)) for name in setup_names]
                 
-                try:
-                    # For individual setup regeneration, we still use generateAllToolpaths
-                    # because Fusion doesn't have a per-setup generation method in the API
-                    future = cam.generateAllToolpaths(False)
-                    
-                    while not future.isGenerationCompleted:
-                        adsk.doEvents()
-                    
-                    if future.isGenerationCompleted:
-                        results.append((setup_name, True, f'Toolpaths regenerated'))
-                    else:
-                        results.append((setup_name, False, f'Generation incomplete'))
-                        all_success = False
-                        
-                except Exception as e:
-                    results.append((setup_name, False, f'Exception: {str(e)}'))
-                    all_success = False
-            
-            # Build summary
-            if all_success:
-                message = f'Toolpaths regenerated for {len(setup_names)} setup(s)'
-            else:
-                failed = [r[0] for r in results if not r[1]]
-                message = f'Failed for setup(s): {", ".join(failed)}'
-            
-            return all_success, message, results
+                while not future.isGenerationCompleted:
+                    adsk.doEvents()
+                    time.sleep(GENERATION_POLL_INTERVAL)
+                
+                return self._collect_generation_results(setup_snapshots)
+                
+            except Exception as e:
+                results = [(setup_name, False, f'Exception: {str(e)}') for setup_name in setup_names]
+                return False, self._summarize_generation(results), results
             
         except Exception as e:
             return False, f'Failed to regenerate toolpaths: {str(e)}', []
@@ -5,29 +5,37 @@ Handles user interaction, file selection, and order validation.
 
 import adsk.core
 import adsk.fusion
-import traceback
 import os
 from pathlib import Path
 
 from validator import OrderValidator
+from report import Report
 import app
 
+# Show the current model's user parameters before processing (modal - debug aid)
+SHOW_PARAMETER_LIST = False
+
 
 class RunOrderCommandHandler(adsk.core.CommandCreatedEventHandler):
     """Handler for when the Run Order command is created"""
     
     def __init__(self):
         super().__init__()
+        # Application is a singleton for the add-in lifetime - fetch it once
+        self._app = adsk.core.Application.get()
+        self._ui = self._app.userInterface
+        # Created on first run and kept, so its result cache spans runs
+        self._validator = None
     
     def notify(self, args: adsk.core.CommandCreatedEventArgs):
         """
         Called when command is created.
         For Phase 1, execute immediately without showing a dialog.
         """
+        app_obj = self._app
+        ui = self._ui
+        
         try:
-            app_obj = adsk.core.Application.get()
-            ui = app_obj.userInterface
-            
             # Get sample order file path
             repo_root = app.get_repo_root()
             sample_order = repo_root / 'samples' / 'sample_order.json'
@@ -41,9 +49,9 @@ class RunOrderCommandHandler(adsk.core.CommandCreatedEventHandler):
                 return
             
             # Validate the sample file
-            schema_path = str(app.get_schema_path())
-            validator = OrderValidator(schema_path)
-            is_valid, errors = validator.validate_json_file(str(sample_order))
+            if self._validator is None:
+                self._validator = OrderValidator(str(app.get_schema_path()))
+            is_valid, errors = self._validator.validate_json_file(str(sample_order))
             
             if not is_valid:
                 error_text = 'Sample order file validation failed:\n\n' + '\n'.join(f'  • {e}' for e in errors[:5])
@@ -52,34 +60,27 @@ class RunOrderCommandHandler(adsk.core.CommandCreatedEventHandler):
                 ui.messageBox(error_text, 'Validation Failed')
                 return
             
-            # Success! Validation complete - now process the order
-            ui.messageBox(
-                f'Order file validated successfully!\n\n{str(sample_order)}\n\nStarting parameter application...',
-                'Processing Order',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
+            # Success! Validation complete - now process the order.
+            # Status is collected into one report shown when the run finishes
+            report = Report('Run Order')
+            report.section('Order file validated', str(sample_order))
             
-            # Phase 2: First check what parameters exist in the current model
-            current_design = app_obj.activeDocument
-            if current_design:
-                design = adsk.fusion.Design.cast(current_design.products.itemByProductType('DesignProductType'))
-                if design:
-                    from parameter_manager import ParameterManager
-                    param_mgr = ParameterManager(design)
-                    existing_params = param_mgr.list_all_parameters()
-                    
-                    if existing_params:
-                        param_list = '\n'.join([f"  • {p['name']} = {p['expression']}" for p in existing_params[:15]])
-                        if len(existing_params) > 15:
-                            param_list += f"\n  ... and {len(existing_params) - 15} more"
+            # Phase 2: First check what parameters exist in the current model (debug aid)
+            if SHOW_PARAMETER_LIST:
+                current_design = app_obj.activeDocument
+                if current_design:
+                    design = adsk.fusion.Design.cast(current_design.products.itemByProductType('DesignProductType'))
+                    if design:
+                        from parameter_manager import ParameterManager
+                        param_mgr = ParameterManager(design)
+                        existing_params = param_mgr.list_all_parameters()
                         
-                        ui.messageBox(
-                            f'Found {len(existing_params)} user parameters in current model:\n\n{param_list}',
-                            'Current Parameters',
-                            adsk.core.MessageBoxButtonTypes.OKButtonType,
-                            adsk.core.MessageBoxIconTypes.InformationIconType
-                        )
+                        if existing_params:
+                            param_list = '\n'.join([f"  • {p['name']} = {p['expression']}" for p in existing_params[:15]])
+                            if len(existing_params) > 15:
+                                param_list += f"\n  ... and {len(existing_params) - 15} more"
+                            
+                            report.section(f'Found {len(existing_params)} user parameters in current model', param_list)
             
             # Phase 2: Load and process the order
             from order_processor import OrderProcessor
@@ -89,23 +90,13 @@ class RunOrderCommandHandler(adsk.core.CommandCreatedEventHandler):
             
             # Show final result
             if success:
-                ui.messageBox(
-                    f'✓ Order Processing Complete!\n\n{message}',
-                    'Success',
-                    adsk.core.MessageBoxButtonTypes.OKButtonType,
-                    adsk.core.MessageBoxIconTypes.InformationIconType
-                )
+                report.section('✓ Order Processing Complete', message)
             else:
-                ui.messageBox(
-                    f'Order Processing Failed:\n\n{message}',
-                    'Error',
-                    adsk.core.MessageBoxButtonTypes.OKButtonType,
-                    adsk.core.MessageBoxIconTypes.WarningIconType
-                )
+                report.section('Order Processing Failed', message)
+            report.show(ui, success)
             
         except Exception as e:
-            app_obj = adsk.core.Application.get()
-            ui = app_obj.userInterface
+            import traceback
             ui.messageBox(f'Failed to execute command:\n{str(e)}\n\n{traceback.format_exc()}', 'Error')
 
 
@@ -3,21 +3,92 @@ Logging utilities for Fusion Manufacturing Pipeline.
 Provides file-based logging since Fusion's console is limited.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Name of the shared logging.Logger
+LOGGER_NAME = 'FusionManufacturingPipeline'
+
+# Bytes buffered in memory before the log file is written
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Section separators used by the log_* helpers
+_BANNER_EQ = '=' * 80
+_BANNER_DASH = '-' * 80
+
+
+class _CachingFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp while the second hasn't changed.
+    Only applies when datefmt has no sub-second fields (the default format adds msecs).
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = None
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(datefmt, self.converter(sec))
+            self._last_sec = sec
+        return self._last_str
+
+
+class _BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that writes through a large buffer.
+    Flushes when the pending-record queue drains or an error is logged,
+    instead of after every record like logging.FileHandler.
+    """
+    
+    def __init__(self, filename: str, pending: queue.SimpleQueue, buffer_size: int = LOG_BUFFER_SIZE):
+        super().__init__(open(filename, 'a', buffering=buffer_size, encoding='utf-8'))
+        self.pending = pending
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR or self.pending.empty():
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            if not self.stream.closed:
+                self.stream.flush()
+                self.stream.close()
+        finally:
+            self.release()
+        super().close()
+
 
 class PipelineLogger:
     """Logger for manufacturing pipeline operations"""
     
-    def __init__(self, log_dir: str = None):
+    __slots__ = ('log_dir', 'logger', 'log_file', '_file_handler', '_listener')
+    
+    def __init__(self, log_dir: str = None, buffer_size: int = LOG_BUFFER_SIZE):
         """
         Initialize logger.
+        Records are queued by the caller and written to disk by a background listener.
         
         Args:
             log_dir: Directory for log files (default: repo_root/logs)
+            buffer_size: Log file write buffer size in bytes
         """
         if log_dir is None:
             # Default to logs directory in repo root
@@ -25,66 +96,100 @@ class PipelineLogger:
             log_dir = repo_root / 'logs'
         
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+        if not self.log_dir.exists():
+            self.log_dir.mkdir(exist_ok=True)
         
         # Create logger
-        self.logger = logging.getLogger('FusionManufacturingPipeline')
+        self.logger = logging.getLogger(LOGGER_NAME)
         self.logger.setLevel(logging.DEBUG)
         
-        # Remove existing handlers
+        # Remove existing handlers, shutting down any previous pipeline logger's
+        # listener thread and file so they don't leak
+        for handler in self.logger.handlers:
+            previous = getattr(handler, 'pipeline_logger', None)
+            if previous is not None:
+                previous.close()
         self.logger.handlers.clear()
         
         # Create file handler with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = self.log_dir / f'pipeline_{timestamp}.log'
         
-        file_handler = logging.FileHandler(str(log_file))
+        log_queue = queue.SimpleQueue()
+        file_handler = _BufferedFileHandler(str(log_file), log_queue, buffer_size)
         file_handler.setLevel(logging.DEBUG)
         
         # Create formatter
-        formatter = logging.Formatter(
+        formatter = _CachingFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(formatter)
         
-        # Add handler
-        self.logger.addHandler(file_handler)
+        # Callers only enqueue records; the listener thread formats and writes them
+        self._file_handler = file_handler
+        self._listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.pipeline_logger = self
+        self.logger.addHandler(queue_handler)
+        atexit.register(self.close)
         
         self.log_file = log_file
-        self.info(f'Logger initialized. Log file: {log_file}')
+        self.info('Logger initialized. Log file: %s', log_file)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
     
-    def info(self, message: str):
+    def info(self, message: str, *args, **kwargs):
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str):
+    def error(self, message: str, *args, **kwargs):
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
     
-    def exception(self, message: str):
+    def exception(self, message: str, *args, **kwargs):
         """Log exception with traceback"""
-        self.logger.exception(message)
+        self.logger.exception(message, *args, **kwargs)
     
     def get_log_path(self) -> str:
         """Get path to current log file"""
         return str(self.log_file)
+    
+    def close(self):
+        """Write out pending records and close the log file"""
+        atexit.unregister(self.close)
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+        self._file_handler.close()
 
 
 # Global logger instance
 _global_logger = None
+_global_logger_lock = threading.Lock()
+
+
+def _find_existing_logger():
+    """
+    Find a PipelineLogger already attached to the shared logging.Logger.
+    Covers this module being reloaded inside a long-running Fusion session.
+    """
+    for handler in logging.getLogger(LOGGER_NAME).handlers:
+        existing = getattr(handler, 'pipeline_logger', None)
+        if existing is not None:
+            return existing
+    return None
 
 
 def get_logger() -> PipelineLogger:
@@ -96,74 +201,89 @@ def get_logger() -> PipelineLogger:
     """
     global _global_logger
     if _global_logger is None:
-        _global_logger = PipelineLogger()
+        with _global_logger_lock:
+            if _global_logger is None:
+                _global_logger = _find_existing_logger() or PipelineLogger()
     return _global_logger
 
 
 def log_order_start(order_id: str, file_path: str):
     """Log start of order processing"""
     logger = get_logger()
-    logger.info('=' * 80)
-    logger.info(f'Starting order processing: {order_id}')
-    logger.info(f'Order file: {file_path}')
-    logger.info('=' * 80)
+    if not logger.logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_BANNER_EQ)
+    logger.info('Starting order processing: %s', order_id)
+    logger.info('Order file: %s', file_path)
+    logger.info(_BANNER_EQ)
 
 
 def log_order_complete(order_id: str, success: bool, message: str = ''):
     """Log completion of order processing"""
     logger = get_logger()
-    logger.info('=' * 80)
+    if not logger.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
+    logger.info(_BANNER_EQ)
     if success:
-        logger.info(f'Order completed successfully: {order_id}')
+        logger.info('Order completed successfully: %s', order_id)
     else:
-        logger.error(f'Order failed: {order_id}')
+        logger.error('Order failed: %s', order_id)
     if message:
-        logger.info(f'Message: {message}')
-    logger.info('=' * 80)
+        logger.info('Message: %s', message)
+    logger.info(_BANNER_EQ)
 
 
 def log_component_start(component_id: str):
     """Log start of component processing"""
     logger = get_logger()
-    logger.info('-' * 80)
-    logger.info(f'Processing component: {component_id}')
+    if not logger.logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_BANNER_DASH)
+    logger.info('Processing component: %s', component_id)
 
 
 def log_component_complete(component_id: str, success: bool, message: str = ''):
     """Log completion of component processing"""
     logger = get_logger()
+    if not logger.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
     if success:
-        logger.info(f'Component completed: {component_id}')
+        logger.info('Component completed: %s', component_id)
     else:
-        logger.error(f'Component failed: {component_id}')
+        logger.error('Component failed: %s', component_id)
     if message:
-        logger.info(f'Message: {message}')
-    logger.info('-' * 80)
+        logger.info('Message: %s', message)
+    logger.info(_BANNER_DASH)
 
 
 def log_parameter_update(param_name: str, old_value: str, new_value: str):
     """Log parameter update"""
     logger = get_logger()
-    logger.debug(f'Parameter updated: {param_name} = {new_value} (was: {old_value})')
+    # Called once per parameter - formatted only if DEBUG is enabled
+    logger.debug('Parameter updated: %s = %s (was: %s)', param_name, new_value, old_value)
 
 
 def log_toolpath_generation(setup_name: str, success: bool, message: str = ''):
     """Log toolpath generation"""
     logger = get_logger()
+    if not logger.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
     if success:
-        logger.info(f'Toolpath generated: {setup_name}')
+        logger.info('Toolpath generated: %s', setup_name)
     else:
-        logger.error(f'Toolpath generation failed: {setup_name}')
+        logger.error('Toolpath generation failed: %s', setup_name)
     if message:
-        logger.debug(f'Details: {message}')
+        logger.debug('Details: %s', message)
 
 
 def log_post_processing(output_file: str, success: bool, message: str = ''):
     """Log post processing"""
     logger = get_logger()
+    if not logger.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
     if success:
-        logger.info(f'Post processing completed: {output_file}')
+        logger.info('Post processing completed: %s', output_file)
     else:
-        logger.error(f'Post processing failed: {output_file}')
+        logger.error('Post processing failed: %s', output_file)
     if message:
-        logger.debug(f'Details: {message}')
+        logger.debug('Details: %s', message)
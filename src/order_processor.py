@@ -5,7 +5,6 @@ Handles loading orders, opening documents, and coordinating operations
 
 import adsk.core
 import adsk.fusion
-import json
 import os
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
@@ -15,20 +14,58 @@ from cam_manager import CAMManager
 from post_processor import PostProcessor
 from logger import get_logger
 
+# Use orjson's C parser when it is installed, stdlib json otherwise.
+# Both accept the raw bytes of the file.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+
+def _document_key(name: str) -> str:
+    """Normalize a document or file name for open-document lookup (drops .f3d)."""
+    return name[:-4] if name.endswith('.f3d') else name
+
 
 class OrderProcessor:
     """Processes manufacturing orders from JSON files"""
     
-    def __init__(self, app: adsk.core.Application):
+    def __init__(self, app: adsk.core.Application, show_modal: bool = False):
         """
         Initialize order processor.
         
         Args:
             app: Fusion Application object
+            show_modal: Also show a modal dialog for each critical failure
         """
         self.app = app
         self.ui = app.userInterface
         self.logger = get_logger()
+        self.show_modal = show_modal
+        # Status lines for the current order, returned in the process_order message
+        self._report: List[str] = []
+    
+    def _note(self, msg: str):
+        """Log a status line and add it to the order report."""
+        self.logger.info(msg)
+        self._report.append(msg)
+    
+    def _critical(self, msg: str, title: str):
+        """
+        Log a critical failure and add it to the order report.
+        Only shows a blocking dialog when show_modal is set.
+        """
+        self.logger.error(msg)
+        self._report.append(msg)
+        if self.show_modal:
+            self.ui.messageBox(
+                msg,
+                title,
+                adsk.core.MessageBoxButtonTypes.OKButtonType,
+                adsk.core.MessageBoxIconTypes.CriticalIconType
+            )
     
     def load_order_file(self, file_path: str) -> Optional[Dict]:
         """
@@ -41,39 +78,49 @@ class OrderProcessor:
             Parsed order dictionary or None on error
         """
         try:
-            with open(file_path, 'r') as f:
-                order = json.load(f)
-            return order
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
         except Exception as e:
-            self.ui.messageBox(f'Failed to load order file:\n{str(e)}', 'Error')
+            self._critical(f'Failed to load order file:\n{str(e)}', 'Error')
             return None
     
-    def open_document(self, file_path: str) -> Tuple[bool, Optional[adsk.core.Document]]:
+    def _build_open_docs_index(self) -> Dict[str, adsk.core.Document]:
+        """
+        Index the currently open documents by normalized name.
+        
+        Returns:
+            Dictionary mapping document name (without .f3d) to Document
+        """
+        return {_document_key(doc.name): doc for doc in self.app.documents}
+    
+    def open_document(self, file_path: str,
+                      open_docs_index: Optional[Dict[str, adsk.core.Document]] = None,
+                      file_name: Optional[str] = None) -> Tuple[bool, Optional[adsk.core.Document]]:
         """
         Open a Fusion 360 document. If a document with matching name is already open, uses that.
         
         Args:
             file_path: Path to .f3d or cloud document, or just filename
+            open_docs_index: Index from _build_open_docs_index, reused across an order.
+                Built on the fly if not given; newly opened documents are added to it.
+            file_name: os.path.basename(file_path) if the caller already has it
             
         Returns:
             Tuple of (success: bool, document: Document or None)
         """
         try:
             # Extract just the filename from path
-            file_name = os.path.basename(file_path)
+            if file_name is None:
+                file_name = os.path.basename(file_path)
             
             # Check if a document with this name is already open
             self.logger.info(f'Looking for open document: {file_name}')
-            for doc in self.app.documents:
-                if doc.name == file_name or doc.name == file_name.replace('.f3d', ''):
-                    self.logger.info(f'Found already open document: {doc.name}')
-                    self.ui.messageBox(
-                        f'Using currently open document:\n{doc.name}',
-                        'Document Found',
-                        adsk.core.MessageBoxButtonTypes.OKButtonType,
-                        adsk.core.MessageBoxIconTypes.InformationIconType
-                    )
-                    return True, doc
+            if open_docs_index is None:
+                open_docs_index = self._build_open_docs_index()
+            doc = open_docs_index.get(_document_key(file_name))
+            if doc:
+                self._note(f'Using currently open document: {doc.name}')
+                return True, doc
             
             # Document not open, try to open it
             self.logger.info(f'Document not open, attempting to open: {file_path}')
@@ -90,11 +137,12 @@ class OrderProcessor:
                 return False, None
             
             self.logger.info(f'Successfully opened document: {doc.name}')
+            open_docs_index[_document_key(file_name)] = doc
             return True, doc
             
         except Exception as e:
             self.logger.exception('Failed to open document')
-            self.ui.messageBox(f'Failed to open document:\n{file_path}\n\n{str(e)}', 'Error')
+            self._critical(f'Failed to open document:\n{file_path}\n\n{str(e)}', 'Error')
             return False, None
     
     def process_order(self, order_file_path: str) -> Tuple[bool, str]:
@@ -107,13 +155,16 @@ class OrderProcessor:
         Returns:
             Tuple of (success: bool, message: str)
         """
+        self._report = []
+        progress = self.ui.progressBar
+        
         try:
             # Load order
             self.logger.info(f'Loading order from: {order_file_path}')
             order = self.load_order_file(order_file_path)
             if not order:
                 self.logger.error('Failed to load order file')
-                return False, 'Failed to load order file'
+                return False, self._with_report('Failed to load order file')
             
             order_id = order.get('orderId', 'unknown')
             components = order.get('components', [])
@@ -121,36 +172,53 @@ class OrderProcessor:
             self.logger.info(f'Processing order: {order_id} with {len(components)} component(s)')
             
             if not components:
-                return False, 'No components found in order'
+                return False, self._with_report('No components found in order')
             
             results = []
             
-            # Process each component
+            # Process each component - progress bar is non-blocking, unlike a message box
+            progress.show('Processing component %v of %m', 0, len(components), False)
+            open_docs_index = self._build_open_docs_index()
             for idx, component in enumerate(components):
-                comp_result = self.process_component(component, idx + 1, len(components))
+                comp_result = self.process_component(component, idx + 1, len(components), open_docs_index)
                 results.append(comp_result)
+                progress.progressValue = idx + 1
+                adsk.doEvents()
             
             # Summary
             success_count = sum(1 for r in results if r[0])
             total_count = len(results)
             
             if success_count == total_count:
-                message = f'Order {order_id} completed successfully!\n\n'
-                message += f'Processed {total_count} component(s)'
-                return True, message
+                message = f'Order {order_id} completed successfully!\n\nProcessed {total_count} component(s)'
+                return True, self._with_report(message)
             else:
-                message = f'Order {order_id} partially completed.\n\n'
-                message += f'{success_count}/{total_count} components successful\n\n'
-                message += 'Failed components:\n'
+                parts = [
+                    f'Order {order_id} partially completed.',
+                    '',
+                    f'{success_count}/{total_count} components successful',
+                    '',
+                    'Failed components:',
+                ]
                 for i, (success, msg) in enumerate(results):
                     if not success:
-                        message += f'  Component {i+1}: {msg}\n'
-                return False, message
+                        parts.append(f'  Component {i+1}: {msg}')
+                return False, self._with_report('\n'.join(parts))
             
         except Exception as e:
-            return False, f'Order processing failed: {str(e)}'
+            return False, self._with_report(f'Order processing failed: {str(e)}')
+            
+        finally:
+            progress.hide()
+    
+    def _with_report(self, message: str) -> str:
+        """Append the collected status lines to a summary message."""
+        if not self._report:
+            return message
+        return message.rstrip('\n') + '\n\nDetails:\n' + '\n'.join(self._report)
     
-    def process_component(self, component: Dict, comp_num: int, total_comps: int) -> Tuple[bool, str]:
+    def process_component(self, component: Dict, comp_num: int, total_comps: int,
+                          open_docs_index: Optional[Dict[str, adsk.core.Document]] = None) -> Tuple[bool, str]:
         """
         Process a single component from the order.
         
@@ -158,6 +226,7 @@ class OrderProcessor:
             component: Component dictionary from order
             comp_num: Component number (1-indexed)
             total_comps: Total number of components
+            open_docs_index: Open-document index shared across the order (see open_document)
             
         Returns:
             Tuple of (success: bool, message: str)
@@ -168,6 +237,7 @@ class OrderProcessor:
             parameters = component.get('parameters', {})
             
             self.logger.info(f'Processing component {comp_num}/{total_comps}: {comp_id}')
+            fusion_basename = os.path.basename(fusion_file)
             self.logger.info(f'  Fusion file: {fusion_file}')
             self.logger.info(f'  Parameters to apply: {len(parameters)}')
             
@@ -178,16 +248,8 @@ class OrderProcessor:
             if not parameters:
                 return False, f'{comp_id}: No parameters specified'
             
-            # Show progress
-            self.ui.messageBox(
-                f'Processing component {comp_num} of {total_comps}:\n{comp_id}',
-                'Processing',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
-            
             # Open the document
-            success, doc = self.open_document(fusion_file)
+            success, doc = self.open_document(fusion_file, open_docs_index, fusion_basename)
             if not success:
                 return False, f'{comp_id}: Failed to open document: {fusion_file}'
             
@@ -211,22 +273,15 @@ class OrderProcessor:
             # Check results
             failed_params = [r for r in results if not r[1]]
             if failed_params:
-                error_msg = f'{comp_id}: Some parameters failed to update:\n'
+                parts = [f'{comp_id}: Some parameters failed to update:']
                 for param_name, success, msg in failed_params:
-                    error_msg += f'  {msg}\n'
-                return False, error_msg
+                    parts.append(f'  {msg}')
+                return False, '\n'.join(parts)
             
             # Success! Parameters updated
             success_msg = f'{comp_id}: Successfully updated {len(parameters)} parameter(s)'
             
-            # Show detailed results
-            details = '\n'.join([f'  {msg}' for _, _, msg in results])
-            self.ui.messageBox(
-                f'{success_msg}\n\n{details}',
-                'Parameters Updated',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
+            self._note(success_msg)
             
             self.logger.info(f'{comp_id}: Parameter updates complete, starting CAM regeneration')
             
@@ -250,14 +305,6 @@ class OrderProcessor:
             if not setup_names:
                 return False, f'{comp_id}: No CAM setups found in document'
             
-            # Show setups found
-            self.ui.messageBox(
-                f'Found {len(setup_names)} CAM setup(s):\n  • ' + '\n  • '.join(setup_names) + '\n\nRegenerating toolpaths...',
-                'CAM Setups Found',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
-            
             # Regenerate ALL toolpaths (requirement: always regenerate all setups)
             self.logger.info(f'{comp_id}: Regenerating toolpaths for all setups')
             regen_success, regen_msg, regen_results = cam_mgr.regenerate_all_toolpaths()
@@ -273,13 +320,11 @@ class OrderProcessor:
             if not regen_success:
                 self.logger.error(f'{comp_id}: Toolpath regeneration failed: {regen_msg}')
                 
-                # Show error details
+                # Record error details
                 error_details = '\n'.join([f'  • {name}: {msg}' for name, success, msg in regen_results if not success])
-                self.ui.messageBox(
+                self._critical(
                     f'{comp_id}: Toolpath regeneration FAILED!\n\n{regen_msg}\n\n{error_details}',
-                    'Toolpath Generation Failed',
-                    adsk.core.MessageBoxButtonTypes.OKButtonType,
-                    adsk.core.MessageBoxIconTypes.CriticalIconType
+                    'Toolpath Generation Failed'
                 )
                 
                 return False, f'{comp_id}: Toolpath regeneration failed: {regen_msg}'
@@ -295,14 +340,6 @@ class OrderProcessor:
             # Get all setups for post processing
             all_setups = cam_mgr.get_all_setups()
             
-            # Show starting message
-            self.ui.messageBox(
-                f'Toolpaths regenerated successfully!\n\nStarting post processing for {len(all_setups)} setup(s)...',
-                'Post Processing',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
-            
             # Post process all setups
             post_success, post_msg, post_results = post_proc.post_process_all_setups(cam_mgr.cam_product, all_setups)
             
@@ -321,39 +358,36 @@ class OrderProcessor:
                 self.logger.error(f'{comp_id}: All post processing failed')
                 
                 error_details = '\n'.join([f'  • {name}: {msg}' for name, success, msg, _ in post_results if not success])
-                self.ui.messageBox(
+                self._critical(
                     f'{comp_id}: Post processing FAILED!\n\n{post_msg}\n\n{error_details}',
-                    'Post Processing Failed',
-                    adsk.core.MessageBoxButtonTypes.OKButtonType,
-                    adsk.core.MessageBoxIconTypes.CriticalIconType
+                    'Post Processing Failed'
                 )
                 
                 return False, f'{comp_id}: Post processing failed: {post_msg}'
             
-            # Success! Show final results
+            # Success! Record final results
             self.logger.info(f'{comp_id}: All operations complete')
             
-            final_msg = f'{comp_id}: Processing complete!\n\n'
-            final_msg += f'✓ Updated {len(parameters)} parameter(s)\n'
-            final_msg += f'✓ Regenerated {len(setup_names)} CAM setup(s)\n'
-            final_msg += f'✓ Generated {len(successful_posts)}/{len(all_setups)} NC program(s):\n'
+            parts = [
+                f'{comp_id}: Processing complete!',
+                '',
+                f'✓ Updated {len(parameters)} parameter(s)',
+                f'✓ Regenerated {len(setup_names)} CAM setup(s)',
+                f'✓ Generated {len(successful_posts)}/{len(all_setups)} NC program(s):',
+            ]
             
             for setup_name, success, msg, file_path in post_results:
                 if success:
                     # Extract just filename from path
                     filename = os.path.basename(file_path) if file_path else 'unknown'
-                    final_msg += f'    • {setup_name}: {filename}\n'
+                    parts.append(f'    • {setup_name}: {filename}')
                 else:
-                    final_msg += f'    • {setup_name}: FAILED ({msg})\n'
+                    parts.append(f'    • {setup_name}: FAILED ({msg})')
             
-            final_msg += f'\nOutput: {output_dir}'
+            parts.append('')
+            parts.append(f'Output: {output_dir}')
             
-            self.ui.messageBox(
-                final_msg,
-                'Component Complete',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
+            self._note('\n'.join(parts))
             
             return True, f'{comp_id}: Complete - {len(successful_posts)} NC file(s) generated'
             
@@ -11,6 +11,8 @@ from typing import Dict, List, Tuple, Optional
 class ParameterManager:
     """Manages parameter operations for Fusion 360 designs"""
     
+    __slots__ = ('design', 'user_parameters', '_by_name')
+    
     def __init__(self, design: adsk.fusion.Design):
         """
         Initialize parameter manager.
@@ -20,6 +22,22 @@ class ParameterManager:
         """
         self.design = design
         self.user_parameters = design.userParameters
+        
+        # Name -> UserParameter lookup, built from one pass over the collection
+        self._by_name = None
+    
+    def _params_by_name(self) -> Dict[str, adsk.fusion.UserParameter]:
+        """Get the name -> UserParameter lookup, building it on first use."""
+        if self._by_name is None:
+            self._by_name = {param.name: param for param in self.user_parameters}
+        return self._by_name
+    
+    def invalidate_cache(self):
+        """
+        Drop the cached parameter lookup.
+        Call after user parameters are added, removed or renamed outside this class.
+        """
+        self._by_name = None
     
     def get_all_parameters(self) -> Dict[str, str]:
         """
@@ -28,10 +46,7 @@ class ParameterManager:
         Returns:
             Dictionary mapping parameter name to expression (value with units)
         """
-        params = {}
-        for param in self.user_parameters:
-            params[param.name] = param.expression
-        return params
+        return {name: param.expression for name, param in self._params_by_name().items()}
     
     def get_parameter_value(self, param_name: str) -> Optional[str]:
         """
@@ -43,7 +58,7 @@ class ParameterManager:
         Returns:
             Parameter expression (value with units) or None if not found
         """
-        param = self.user_parameters.itemByName(param_name)
+        param = self._params_by_name().get(param_name)
         if param:
             return param.expression
         return None
@@ -61,7 +76,7 @@ class ParameterManager:
         """
         try:
             # Get the parameter
-            param = self.user_parameters.itemByName(param_name)
+            param = self._params_by_name().get(param_name)
             
             if not param:
                 return False, f"Parameter '{param_name}' not found in model"
@@ -80,6 +95,7 @@ class ParameterManager:
     def update_parameters_batch(self, parameters: Dict[str, str]) -> List[Tuple[str, bool, str]]:
         """
         Update multiple parameters at once.
+        Changed parameters are applied together so the model recomputes once.
         
         Args:
             parameters: Dictionary mapping parameter name to new value
@@ -87,13 +103,45 @@ class ParameterManager:
         Returns:
             List of tuples (param_name, success, message) for each parameter
         """
-        results = []
+        results = {}
         
+        params_by_name = self._params_by_name()
+        
+        to_modify = []
         for param_name, new_value in parameters.items():
-            success, message = self.update_parameter(param_name, new_value)
-            results.append((param_name, success, message))
+            param = params_by_name.get(param_name)
+            
+            if not param:
+                results[param_name] = (False, f"Parameter '{param_name}' not found in model")
+                continue
+            
+            old_value = param.expression
+            if old_value == new_value:
+                # Skip no-op assignments - they still trigger a recompute
+                results[param_name] = (True, f"'{param_name}' already '{new_value}'")
+            else:
+                to_modify.append((param_name, param, old_value, new_value))
+        
+        # Apply all changes with a single model recompute where the API supports it
+        batched = False
+        if to_modify and hasattr(self.design, 'modifyParameters'):
+            try:
+                batched = self.design.modifyParameters(
+                    [param for _, param, _, _ in to_modify],
+                    [adsk.core.ValueInput.createByString(str(new_value)) for _, _, _, new_value in to_modify]
+                )
+            except Exception:
+                batched = False
         
-        return results
+        for param_name, param, old_value, new_value in to_modify:
+            if batched:
+                results[param_name] = (True, f"Updated '{param_name}' from '{old_value}' to '{new_value}'")
+            else:
+                # Batch unavailable or rejected - update one at a time so each
+                # failure is reported against its own parameter
+                results[param_name] = self.update_parameter(param_name, new_value)
+        
+        return [(param_name,) + results[param_name] for param_name in parameters]
     
     def validate_parameters_exist(self, param_names: List[str]) -> Tuple[bool, List[str]]:
         """
@@ -105,12 +153,8 @@ class ParameterManager:
         Returns:
             Tuple of (all_exist: bool, missing_params: List[str])
         """
-        missing = []
-        
-        for param_name in param_names:
-            param = self.user_parameters.itemByName(param_name)
-            if not param:
-                missing.append(param_name)
+        params_by_name = self._params_by_name()
+        missing = [param_name for param_name in param_names if param_name not in params_by_name]
         
         return len(missing) == 0, missing
     
@@ -124,7 +168,7 @@ class ParameterManager:
         Returns:
             Dictionary with parameter details or None if not found
         """
-        param = self.user_parameters.itemByName(param_name)
+        param = self._params_by_name().get(param_name)
         
         if not param:
             return None
@@ -145,15 +189,15 @@ class ParameterManager:
         Returns:
             List of parameter info dictionaries
         """
-        params = []
-        for param in self.user_parameters:
-            params.append({
-                'name': param.name,
+        return [
+            {
+                'name': name,
                 'expression': param.expression,
                 'value': param.value,
                 'unit': param.unit
-            })
-        return params
+            }
+            for name, param in self._params_by_name().items()
+        ]
 
 
 def format_parameter_value(value: any, param_type: str = "string") -> str:
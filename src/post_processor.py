@@ -7,10 +7,26 @@ import adsk.core
 import adsk.fusion
 import adsk.cam
 import os
-from typing import List, Tuple, Optional
+import time
+from typing import Any, Dict, List, Tuple, Optional
 from pathlib import Path
 
 
+# User-facing messages for _post_setup result codes
+_POST_MESSAGES = {
+    'no_toolpaths': "Setup '{setup_name}' has no valid toolpaths to post",
+    'no_post': "Post processor not found: {detail}",
+    'file_missing': "Post process completed but file not found: {filename}",
+    'generated': "Generated {filename} ({detail} bytes)",
+    'exception': "Post processing failed: {detail}",
+}
+
+
+def _post_message(code: str, setup_name: str, program_number: int, detail: Any) -> str:
+    """Format the message for a raw post result"""
+    return _POST_MESSAGES[code].format(setup_name=setup_name, filename=f"{program_number}.nc", detail=detail)
+
+
 class PostProcessor:
     """Manages post processing operations for CAM setups"""
     
@@ -25,7 +41,10 @@ class PostProcessor:
         self.app = app
         self.ui = app.userInterface
         self.output_dir = Path(output_dir)
+        self._output_dir_str = os.fspath(self.output_dir)
         self.counter_file = Path(__file__).parent.parent / 'nc_program_counter.txt'
+        # genericPostFolder -> (post config path, exists)
+        self._post_config_cache: Dict[str, Tuple[str, bool]] = {}
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -38,27 +57,71 @@ class PostProcessor:
         Returns:
             Next program number
         """
-        try:
-            if self.counter_file.exists():
-                with open(self.counter_file, 'r') as f:
-                    last_number = int(f.read().strip())
-                    next_number = last_number + 1
-            else:
-                # First run, start at 1001
-                next_number = 1001
-            
-            # Save the new number
-            with open(self.counter_file, 'w') as f:
-                f.write(str(next_number))
+        return self.reserve_program_numbers(1).start
+    
+    def reserve_program_numbers(self, count: int) -> range:
+        """
+        Reserve a contiguous block of program numbers with one counter update.
+        
+        Args:
+            count: Number of program numbers needed
             
-            return next_number
+        Returns:
+            Range of reserved program numbers
+        """
+        try:
+            # Counter is ASCII digits - int() parses the bytes directly
+            with open(self.counter_file, 'rb') as f:
+                start = int(f.read()) + 1
+        except FileNotFoundError:
+            # First run, start at 1001
+            start = 1001
+        except (OSError, ValueError):
+            # Unreadable/corrupt counter - default to timestamp-based naming
+            start = int(time.time() % 10000) + 1000
+            return range(start, start + count)
+        
+        # Save the last reserved number - write a temp file and swap it in
+        # so a crash never leaves a truncated counter
+        tmp_file = self.counter_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'w', buffering=8192) as f:
+                f.write(str(start + count - 1))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.counter_file)
+        except OSError:
+            # Failed write - don't leave the temp file behind
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+            # Default to timestamp-based naming
+            start = int(time.time() % 10000) + 1000
+        
+        return range(start, start + count)
+    
+    def resolve_post_config(self, cam: adsk.cam.CAM) -> Tuple[str, bool]:
+        """
+        Get the post processor path and whether it exists, cached per post folder.
+        
+        Args:
+            cam: CAM object
             
-        except Exception as e:
-            # If anything goes wrong, default to timestamp-based naming
-            import time
-            return int(time.time() % 10000) + 1000
+        Returns:
+            Tuple of (post_config_path: str, exists: bool)
+        """
+        post_folder = cam.genericPostFolder
+        cached = self._post_config_cache.get(post_folder)
+        if cached is None:
+            # richauto.cps is in Fusion's post processor library
+            post_config = post_folder + '/richauto.cps'
+            cached = (post_config, os.path.exists(post_config))
+            self._post_config_cache[post_folder] = cached
+        return cached
     
-    def post_process_setup(self, cam: adsk.cam.CAM, setup: adsk.cam.Setup, program_number: int) -> Tuple[bool, str, Optional[str]]:
+    def post_process_setup(self, cam: adsk.cam.CAM, setup: adsk.cam.Setup, program_number: int,
+                           post_config: Optional[Tuple[str, bool]] = None) -> Tuple[bool, str, Optional[str]]:
         """
         Post process a single setup to generate G-code.
         
@@ -66,40 +129,51 @@ class PostProcessor:
             cam: CAM object
             setup: Setup to post process
             program_number: Program number for the file (e.g., 1001)
+            post_config: Result of resolve_post_config, looked up here if not given
             
         Returns:
             Tuple of (success: bool, message: str, output_file_path: str or None)
         """
+        success, code, detail, file_path = self._post_setup(cam, setup, program_number, post_config)
         try:
             setup_name = setup.name
-            
-            # Check if setup has any valid toolpaths
-            has_toolpaths = False
-            for operation in setup.allOperations:
-                if operation.hasToolpath and not operation.isSuppressed:
-                    has_toolpaths = True
-                    break
+        except Exception:
+            setup_name = ''
+        return success, _post_message(code, setup_name, program_number, detail), file_path
+    
+    def _post_setup(self, cam: adsk.cam.CAM, setup: adsk.cam.Setup, program_number: int,
+                    post_config: Optional[Tuple[str, bool]] = None) -> Tuple[bool, str, Any, Optional[str]]:
+        """
+        Post process a single setup, returning a raw result for _post_message.
+        
+        Returns:
+            Tuple of (success: bool, code: str, detail, output_file_path: str or None)
+        """
+        try:
+            # Check if setup has any valid toolpaths (stops at the first one)
+            operations = setup.allOperations
+            has_toolpaths = any(op.hasToolpath and not op.isSuppressed for op in operations)
             
             if not has_toolpaths:
-                return False, f"Setup '{setup_name}' has no valid toolpaths to post", None
+                return False, 'no_toolpaths', None, None
             
             # Build output filename: program_number.nc (e.g., 1001.nc)
-            output_filename = f"{program_number}.nc"
-            output_path = self.output_dir / output_filename
+            output_path = self.output_dir / f"{program_number}.nc"
             
             # Get post processor path
-            # richauto.cps is in Fusion's post processor library
-            post_config = cam.genericPostFolder + '/richauto.cps'
+            if post_config is None:
+                post_config = self.resolve_post_config(cam)
+            post_path, post_exists = post_config
             
             # Check if post processor exists
-            if not os.path.exists(post_config):
-                return False, f"Post processor not found: {post_config}", None
+            if not post_exists:
+                return False, 'no_post', post_path, None
             
             # Create post input
             post_input = adsk.cam.PostProcessInput.create(
                 str(program_number),  # Program name/number
-                post_config,           # Post processor path
-                str(self.output_dir),  # Output folder
+                post_path,             # Post processor path
+                self._output_dir_str,  # Output folder
                 adsk.cam.PostOutputUnitOptions.DocumentUnitsOutput  # Use document units
             )
             
@@ -109,15 +183,15 @@ class PostProcessor:
             # Post process the setup
             cam.postProcess(setup, post_input)
             
-            # Verify file was created
-            if output_path.exists():
+            # Verify file was created (one stat for both existence and size)
+            try:
                 file_size = output_path.stat().st_size
-                return True, f"Generated {output_filename} ({file_size} bytes)", str(output_path)
-            else:
-                return False, f"Post process completed but file not found: {output_filename}", None
+            except FileNotFoundError:
+                return False, 'file_missing', None, None
+            return True, 'generated', file_size, str(output_path)
             
         except Exception as e:
-            return False, f"Post processing failed: {str(e)}", None
+            return False, 'exception', e, None
     
     def post_process_all_setups(self, cam: adsk.cam.CAM, setups: List[adsk.cam.Setup]) -> Tuple[bool, str, List[Tuple[str, bool, str, Optional[str]]]]:
         """
@@ -130,32 +204,51 @@ class PostProcessor:
         Returns:
             Tuple of (overall_success: bool, message: str, results: List[(setup_name, success, message, file_path)])
         """
-        results = []
-        successful_posts = 0
-        output_files = []
+        # Post processor path is the same for every setup. Resolve it before
+        # showing progress or reserving program numbers, so a failure here
+        # leaves no dialog open and burns no numbers.
+        try:
+            post_config = self.resolve_post_config(cam)
+        except Exception as e:
+            results = [
+                (setup.name, False, _post_message('exception', setup.name, None, e), None)
+                for setup in setups
+            ]
+            return False, f"Post processing failed for all {len(setups)} setup(s)", results
         
-        for setup in setups:
-            setup_name = setup.name
-            
-            # Get next program number for this setup
-            program_number = self.get_next_program_number()
-            
-            # Show progress
-            self.ui.messageBox(
-                f'Post processing setup:\n{setup_name}\n\nProgram: {program_number}.nc',
-                'Generating G-code',
-                adsk.core.MessageBoxButtonTypes.OKButtonType,
-                adsk.core.MessageBoxIconTypes.InformationIconType
-            )
-            
-            # Post process this setup
-            success, message, file_path = self.post_process_setup(cam, setup, program_number)
-            
-            results.append((setup_name, success, message, file_path))
-            
-            if success:
-                successful_posts += 1
-                output_files.append(file_path)
+        # Reserve program numbers for every setup in one counter update
+        program_numbers = self.reserve_program_numbers(len(setups))
+        
+        # Raw (setup_name, program_number, success, code, detail, file_path) per setup;
+        # messages are formatted once the posts are done
+        raw_results = []
+        
+        # One non-modal progress dialog for the whole batch
+        progress = self.ui.createProgressDialog()
+        progress.isCancelButtonShown = False
+        progress.show('Generating G-code', '%v of %m setups done', 0, len(setups), 0)
+        try:
+            # Posts run serially on purpose: the Fusion API may only be called from
+            # the main thread, so cam.postProcess (and the toolpath check before it)
+            # can't be handed to a worker pool or asyncio.to_thread
+            for idx, (setup, program_number) in enumerate(zip(setups, program_numbers)):
+                setup_name = setup.name
+                
+                # Show progress (%v/%m are filled in by the dialog)
+                progress.message = f'Posting {setup_name} ({program_number}.nc) - %v of %m setups done'
+                adsk.doEvents()
+                
+                # Post process this setup
+                raw_results.append((setup_name, program_number) + self._post_setup(cam, setup, program_number, post_config))
+                progress.progressValue = idx + 1
+        finally:
+            progress.hide()
+        
+        results = [
+            (setup_name, success, _post_message(code, setup_name, program_number, detail), file_path)
+            for setup_name, program_number, success, code, detail, file_path in raw_results
+        ]
+        successful_posts = sum(1 for r in results if r[1])
         
         # Build summary
         if successful_posts == len(setups):
@@ -172,7 +265,7 @@ class PostProcessor:
     
     def get_output_directory(self) -> str:
         """Get the configured output directory path."""
-        return str(self.output_dir)
+        return self._output_dir_str
     
     def get_current_program_number(self) -> int:
         """
@@ -182,9 +275,8 @@ class PostProcessor:
             Current program number or 1000 if not initialized
         """
         try:
-            if self.counter_file.exists():
-                with open(self.counter_file, 'r') as f:
-                    return int(f.read().strip())
-            return 1000  # Not yet initialized
-        except:
+            with open(self.counter_file, 'rb') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            # Not yet initialized (no counter file) or unreadable
             return 1000
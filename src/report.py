@@ -0,0 +1,54 @@
+"""
+Report builder for Fusion Manufacturing Pipeline
+Collects user-facing status into one summary so a run shows a single message box
+"""
+
+import adsk.core
+from typing import List, Optional, Tuple
+
+
+class Report:
+    """Accumulates report sections and shows them in one message box"""
+    
+    def __init__(self, title: str):
+        """
+        Initialize report.
+        
+        Args:
+            title: Message box title
+        """
+        self.title = title
+        self._sections: List[Tuple[Optional[str], str]] = []
+    
+    def section(self, heading: Optional[str], body: str):
+        """
+        Add a section to the report.
+        
+        Args:
+            heading: Section heading, or None for a plain paragraph
+            body: Section text
+        """
+        self._sections.append((heading, body))
+    
+    def text(self) -> str:
+        """Get the full report text."""
+        parts = []
+        for heading, body in self._sections:
+            parts.append(f'{heading}:\n{body}' if heading else body)
+        return '\n\n'.join(parts)
+    
+    def show(self, ui: adsk.core.UserInterface, success: bool = True):
+        """
+        Show the report in a single message box.
+        
+        Args:
+            ui: Fusion UserInterface object
+            success: Use the information icon if True, warning icon otherwise
+        """
+        icon = adsk.core.MessageBoxIconTypes.InformationIconType if success else adsk.core.MessageBoxIconTypes.WarningIconType
+        ui.messageBox(
+            self.text(),
+            self.title,
+            adsk.core.MessageBoxButtonTypes.OKButtonType,
+            icon
+        )
@@ -5,58 +5,150 @@ This module provides schema validation independent of Fusion API,
 allowing for pure Python unit testing.
 """
 
+import functools
+import hashlib
 import json
-from typing import Dict, List, Tuple, Any
+import re
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import BinaryIO, Dict, List, Mapping, Optional, Tuple, Union, Any
 from pathlib import Path
 
+# Use orjson's parser when it is installed. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so the error handling below covers both.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Version string format X.Y.Z - use with fullmatch so a trailing newline is rejected
+_VERSION_RE = re.compile(r'\d+\.\d+\.\d+')
+
+# Exact types a parameter value may have. Parsed JSON only produces these
+# built-in types, so an exact type() lookup replaces isinstance(). bool is
+# listed explicitly to keep accepting true/false, as isinstance(x, int) did.
+_VALID_PARAM_TYPES = frozenset({int, float, str, bool})
+
+# Validation results remembered per validator, keyed by order file content hash
+RESULT_CACHE_SIZE = 256
+
+# Required keys, checked with one set difference against dict.keys()
+_ORDER_REQUIRED = frozenset({'version', 'orderId', 'components'})
+_COMP_REQUIRED = frozenset({'componentId', 'fusionModelPath', 'parameters'})
+
+# schema.json shipped with the add-in
+_BUNDLED_SCHEMA_PATH = Path(__file__).parent.parent / "schema.json"
+
+# Sentinel for component fields that are absent (as opposed to null)
+_MISSING = object()
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: objects become mapping proxies and arrays tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _load_schema_cached(path_str: str, mtime_ns: int) -> Mapping:
+    """
+    Load and parse a schema file, memoized per path and modification time.
+    
+    The result is shared between validators, so it is returned read-only
+    at every level.
+    """
+    with open(path_str, 'rb') as f:
+        return _freeze(_loads(f.read()))
+
+
 class OrderValidator:
     """Validates manufacturing order JSON against schema"""
     
-    def __init__(self, schema_path: str = None):
+    def __init__(self, schema_path: str = None, schema: Optional[Mapping] = None):
         """
         Initialize validator with schema
         
         Args:
             schema_path: Path to schema.json (optional, defaults to repo root)
+            schema: Already-parsed schema to use instead of a schema file (optional)
         """
+        # Schema is loaded on first use
+        self._schema = None
+        # blake2b digest of order file bytes -> (is_valid, errors)
+        self._result_cache = OrderedDict()
+        
+        if schema is not None:
+            # In-memory schema - nothing to load from disk
+            self.schema_path = None
+            self._schema = _freeze(schema)
+            return
+        
         if schema_path is None:
             # Default to schema.json in repo root
-            repo_root = Path(__file__).parent.parent
-            schema_path = repo_root / "schema.json"
+            schema_path = _BUNDLED_SCHEMA_PATH
         
         self.schema_path = Path(schema_path)
-        self.schema = self._load_schema()
+        if not self.schema_path.exists():
+            raise ValidationError(f"Schema file not found: {self.schema_path}")
+    
+    @property
+    def schema(self) -> Mapping:
+        """Parsed schema (loaded on first access)"""
+        if self._schema is None:
+            self._schema = self._load_schema()
+        return self._schema
     
-    def _load_schema(self) -> Dict:
-        """Load JSON schema from file"""
+    def _load_schema(self) -> Mapping:
+        """Load JSON schema from file (cached until the file changes)"""
         try:
-            with open(self.schema_path, 'r') as f:
-                return json.load(f)
+            resolved = self.schema_path.resolve()
+            return _load_schema_cached(str(resolved), resolved.stat().st_mtime_ns)
         except FileNotFoundError:
             raise ValidationError(f"Schema file not found: {self.schema_path}")
         except json.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in schema file: {e}")
     
-    def validate_json_file(self, order_path: str) -> Tuple[bool, List[str]]:
+    def validate_json_file(self, order_path: Union[str, bytes, BinaryIO]) -> Tuple[bool, List[str]]:
         """
         Validate an order JSON file
         
         Args:
-            order_path: Path to order JSON file
+            order_path: Path to order JSON file, or the file's content as bytes
+                or a binary file object
             
         Returns:
             Tuple of (is_valid, error_messages)
         """
         try:
-            with open(order_path, 'r') as f:
-                order_data = json.load(f)
-            return self.validate_order(order_data)
+            if isinstance(order_path, (bytes, bytearray)):
+                order_bytes = bytes(order_path)
+            elif hasattr(order_path, 'read'):
+                order_bytes = order_path.read()
+            else:
+                with open(order_path, 'rb') as f:
+                    order_bytes = f.read()
+            
+            # Identical file content gives an identical result
+            digest = hashlib.blake2b(order_bytes, digest_size=16).digest()
+            cached = self._result_cache.get(digest)
+            if cached is not None:
+                self._result_cache.move_to_end(digest)
+                return cached[0], list(cached[1])
+            
+            is_valid, errors = self.validate_order(_loads(order_bytes))
+            self._result_cache[digest] = (is_valid, errors)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            return is_valid, list(errors)
         except FileNotFoundError:
             return False, [f"Order file not found: {order_path}"]
         except json.JSONDecodeError as e:
@@ -78,14 +170,10 @@ class OrderValidator:
         if not isinstance(order_data, dict):
             return False, ["Order must be a JSON object"]
         
-        # Required fields
-        required_fields = ['version', 'orderId', 'components']
-        for field in required_fields:
-            if field not in order_data:
-                errors.append(f"Missing required field: '{field}'")
-        
-        if errors:
-            return False, errors
+        # Required fields (sorted so the error order is stable)
+        missing = _ORDER_REQUIRED - order_data.keys()
+        if missing:
+            return False, [f"Missing required field: '{field}'" for field in sorted(missing)]
         
         # Validate version format
         version = order_data.get('version', '')
@@ -104,17 +192,12 @@ class OrderValidator:
             errors.append("components array must contain at least 1 item")
         else:
             # Validate each component
-            component_ids = set()
             for idx, component in enumerate(components):
                 comp_errors = self._validate_component(component, idx)
                 errors.extend(comp_errors)
-                
-                # Check for duplicate componentIds
-                comp_id = component.get('componentId')
-                if comp_id:
-                    if comp_id in component_ids:
-                        errors.append(f"Duplicate componentId: '{comp_id}'")
-                    component_ids.add(comp_id)
+            
+            # Check for duplicate componentIds
+            errors.extend(self._find_duplicate_ids(components))
         
         # Validate outputConfig if present
         if 'outputConfig' in order_data:
@@ -123,14 +206,20 @@ class OrderValidator:
         
         return len(errors) == 0, errors
     
+    def _find_duplicate_ids(self, components: List) -> List[str]:
+        """
+        Report componentIds used by more than one component.
+        
+        Only well-formed (non-empty string) IDs are counted; malformed ones
+        are already reported by _validate_component.
+        """
+        comp_ids = (component.get('componentId') for component in components if isinstance(component, dict))
+        counts = Counter(comp_id for comp_id in comp_ids if comp_id and isinstance(comp_id, str))
+        return [f"Duplicate componentId: '{comp_id}'" for comp_id, count in counts.items() if count > 1]
+    
     def _validate_version(self, version: str) -> bool:
         """Validate version string format (X.Y.Z)"""
-        if not isinstance(version, str):
-            return False
-        parts = version.split('.')
-        if len(parts) != 3:
-            return False
-        return all(part.isdigit() for part in parts)
+        return isinstance(version, str) and _VERSION_RE.fullmatch(version) is not None
     
     def _validate_component(self, component: Dict, index: int) -> List[str]:
         """Validate a single component object"""
@@ -140,25 +229,29 @@ class OrderValidator:
         if not isinstance(component, dict):
             return [f"{prefix}: Must be an object"]
         
+        # Fetch every field once; _MISSING marks an absent key
+        get = component.get
+        comp_id = get('componentId', _MISSING)
+        model_path = get('fusionModelPath', _MISSING)
+        parameters = get('parameters', _MISSING)
+        setup_names = get('setupNames', _MISSING)
+        config = get('postProcessorConfig', _MISSING)
+        
         # Required fields
-        required_fields = ['componentId', 'fusionModelPath', 'parameters']
-        for field in required_fields:
-            if field not in component:
-                errors.append(f"{prefix}: Missing required field '{field}'")
+        missing = _COMP_REQUIRED - component.keys()
+        if missing:
+            errors.extend(f"{prefix}: Missing required field '{field}'" for field in sorted(missing))
         
-        # Validate componentId
-        comp_id = component.get('componentId', '')
+        # Validate componentId (_MISSING is not a str, so absent fails here too)
         if not comp_id or not isinstance(comp_id, str):
             errors.append(f"{prefix}: componentId must be a non-empty string")
         
         # Validate fusionModelPath
-        model_path = component.get('fusionModelPath', '')
         if not model_path or not isinstance(model_path, str):
             errors.append(f"{prefix}: fusionModelPath must be a non-empty string")
         
         # Validate parameters object
-        parameters = component.get('parameters')
-        if parameters is not None:
+        if parameters is not _MISSING and parameters is not None:
             if not isinstance(parameters, dict):
                 errors.append(f"{prefix}: parameters must be an object")
             else:
@@ -166,18 +259,15 @@ class OrderValidator:
                 errors.extend(param_errors)
         
         # Validate setupNames if present
-        if 'setupNames' in component:
-            setup_names = component['setupNames']
+        if setup_names is not _MISSING:
             if not isinstance(setup_names, list):
                 errors.append(f"{prefix}: setupNames must be an array")
             elif not all(isinstance(name, str) for name in setup_names):
                 errors.append(f"{prefix}: All setupNames must be strings")
         
         # Validate postProcessorConfig if present
-        if 'postProcessorConfig' in component:
-            config = component['postProcessorConfig']
-            if not isinstance(config, dict):
-                errors.append(f"{prefix}: postProcessorConfig must be an object")
+        if config is not _MISSING and not isinstance(config, dict):
+            errors.append(f"{prefix}: postProcessorConfig must be an object")
         
         return errors
     
@@ -192,8 +282,7 @@ class OrderValidator:
                 continue
             
             # Parameter value must be number, string, or integer
-            valid_types = (int, float, str)
-            if not isinstance(param_value, valid_types):
+            if type(param_value) not in _VALID_PARAM_TYPES:
                 errors.append(
                     f"{prefix}.parameters.{param_name}: "
                     f"Invalid value type (must be number, string, or integer)"
@@ -227,6 +316,12 @@ class OrderValidator:
         return self.schema.get('version', 'unknown')
 
 
+@functools.lru_cache(maxsize=8)
+def _shared_validator(schema_path: Optional[str]) -> OrderValidator:
+    """One validator per schema path, so repeat calls reuse its result cache"""
+    return OrderValidator(schema_path)
+
+
 def validate_order_file(order_path: str, schema_path: str = None) -> Tuple[bool, List[str]]:
     """
     Convenience function to validate an order file
@@ -238,8 +333,7 @@ def validate_order_file(order_path: str, schema_path: str = None) -> Tuple[bool,
     Returns:
         Tuple of (is_valid, error_messages)
     """
-    validator = OrderValidator(schema_path)
-    return validator.validate_json_file(order_path)
+    return _shared_validator(schema_path).validate_json_file(order_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures for the order validator tests
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schema.json"
+SAMPLE_ORDER_PATH = Path(__file__).parent.parent / "samples" / "sample_order.json"
+
+
+@pytest.fixture(scope="session")
+def sample_path():
+    """Path to the sample order, checked once per session (tests skip if it is missing)"""
+    if not SAMPLE_ORDER_PATH.exists():
+        pytest.skip("samples/sample_order.json not found")
+    return SAMPLE_ORDER_PATH
+
+
+@pytest.fixture(scope="session")
+def compiled_validator():
+    """jsonschema validator for schema.json, checked and compiled once per session"""
+    jsonschema = pytest.importorskip("jsonschema")
+    schema = json.loads(SCHEMA_PATH.read_bytes())
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run a test once per JSON parser the validator can use (orjson skipped if missing)"""
+    import validator as validator_module
+    if request.param == "orjson":
+        loads = pytest.importorskip("orjson").loads
+    else:
+        loads = json.loads
+    monkeypatch.setattr(validator_module, "_loads", loads)
+    return request.param
@@ -0,0 +1,45 @@
+"""
+Unit tests for the pipeline logger
+
+Run with: python -m pytest tests/test_logger.py -v
+"""
+
+import logging
+import threading
+
+import pytest
+
+import logger as logger_module
+from logger import LOGGER_NAME, PipelineLogger
+
+
+@pytest.fixture
+def pipeline_logger(tmp_path):
+    """Logger writing to a temporary directory, detached from the shared logging.Logger afterwards"""
+    pipeline_logger = PipelineLogger(str(tmp_path))
+    yield pipeline_logger
+    pipeline_logger.close()
+    logging.getLogger(LOGGER_NAME).handlers.clear()
+
+
+class TestPipelineLogger:
+    """Test the queued file logger"""
+    
+    def test_records_from_thread_written_on_close(self, pipeline_logger):
+        """Test records logged from another thread are in the file after close()"""
+        worker = threading.Thread(target=pipeline_logger.info, args=('From worker: %s', 'comp-001'))
+        worker.start()
+        worker.join()
+        pipeline_logger.error('Main thread error')
+        pipeline_logger.close()
+        
+        content = open(pipeline_logger.get_log_path(), encoding='utf-8').read()
+        assert 'INFO - From worker: comp-001' in content
+        assert 'ERROR - Main thread error' in content
+    
+    def test_close_unregisters_atexit(self, pipeline_logger, monkeypatch):
+        """Test close() removes the atexit hook registered at startup"""
+        unregistered = []
+        monkeypatch.setattr(logger_module.atexit, 'unregister', unregistered.append)
+        pipeline_logger.close()
+        assert unregistered == [pipeline_logger.close]
@@ -4,58 +4,114 @@ Unit tests for order validator
 Run with: python -m pytest tests/test_validator.py -v
 """
 
+import copy
+import io
 import json
+import os
+import re
 import pytest
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from validator import OrderValidator, ValidationError, validate_order_file
 
+# Serialize test JSON with orjson when it is installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def validator():
-    """Create validator instance with schema"""
+    """Create validator instance with schema (shared per session/xdist worker - tests must not mutate it)"""
     return OrderValidator()
 
 
+# Code for each error message OrderValidator produces, so tests assert on the
+# kind of error rather than its exact wording. A code may use the pattern's
+# 'field' group; TestErrorCodes keeps this table in step with the validator.
+_ERROR_CODE_PATTERNS = tuple((code, re.compile(pattern, re.DOTALL)) for code, pattern in (
+    ('order.not_object', r"Order must be a JSON object"),
+    ('{field}.missing', r"Missing required field: '(?P<field>\w+)'"),
+    ('version.format', r"Invalid version format: .*"),
+    ('orderId.empty', r"orderId cannot be empty"),
+    ('components.not_array', r"components must be an array"),
+    ('components.min_items', r"components array must contain at least 1 item"),
+    ('componentId.duplicate', r"Duplicate componentId: .*"),
+    ('component.not_object', r"Component\[\d+\]: Must be an object"),
+    ('component.{field}.missing', r"Component\[\d+\]: Missing required field '(?P<field>\w+)'"),
+    ('component.{field}.invalid', r"Component\[\d+\]: (?P<field>\w+) must be a non-empty string"),
+    ('component.{field}.not_object', r"Component\[\d+\]: (?P<field>\w+) must be an object"),
+    ('component.setupNames.not_array', r"Component\[\d+\]: setupNames must be an array"),
+    ('component.setupNames.not_strings', r"Component\[\d+\]: All setupNames must be strings"),
+    ('parameters.name_invalid', r"Component\[\d+\]\.parameters: Invalid parameter name"),
+    ('parameters.value_type', r"Component\[\d+\]\.parameters\..*: Invalid value type .*"),
+    ('outputConfig.not_object', r"outputConfig must be an object"),
+    ('outputConfig.{field}.type', r"outputConfig\.(?P<field>\w+) must be an? \w+"),
+    ('file.not_found', r"Order file not found: .*"),
+    ('file.invalid_json', r"Invalid JSON syntax: .*"),
+))
+
+
+def error_codes(errors) -> frozenset:
+    """Codes for the given error messages (unrecognized messages are skipped)"""
+    codes = set()
+    for error in errors:
+        for code, pattern in _ERROR_CODE_PATTERNS:
+            match = pattern.fullmatch(error)
+            if match:
+                codes.add(code.format(**match.groupdict()))
+                break
+    return frozenset(codes)
+
+
+def has_error(errors, code: str) -> bool:
+    """Whether any error message has the given code"""
+    return code in error_codes(errors)
+
+
+# Canonical orders, built once; fixtures hand each test its own deep copy
+_VALID_ORDER_TEMPLATE = {
+    "version": "1.0.0",
+    "orderId": "TEST-001",
+    "timestamp": "2025-10-24T09:00:00Z",
+    "components": [
+        {
+            "componentId": "comp-001",
+            "fusionModelPath": "C:\\Models\\test.f3d",
+            "parameters": {
+                "component_height": "96 in",
+                "component_width": 36.5,
+                "door_hinging_right": 1
+            }
+        }
+    ]
+}
+
+_MINIMAL_ORDER_TEMPLATE = {
+    "version": "1.0.0",
+    "orderId": "MIN-001",
+    "components": [
+        {
+            "componentId": "comp-001",
+            "fusionModelPath": "test.f3d",
+            "parameters": {}
+        }
+    ]
+}
+
+
 @pytest.fixture
 def valid_order():
     """Return a valid order dictionary"""
-    return {
-        "version": "1.0.0",
-        "orderId": "TEST-001",
-        "timestamp": "2025-10-24T09:00:00Z",
-        "components": [
-            {
-                "componentId": "comp-001",
-                "fusionModelPath": "C:\\Models\\test.f3d",
-                "parameters": {
-                    "component_height": "96 in",
-                    "component_width": 36.5,
-                    "door_hinging_right": 1
-                }
-            }
-        ]
-    }
+    return copy.deepcopy(_VALID_ORDER_TEMPLATE)
 
 
 @pytest.fixture
 def minimal_order():
     """Return minimal valid order (only required fields)"""
-    return {
-        "version": "1.0.0",
-        "orderId": "MIN-001",
-        "components": [
-            {
-                "componentId": "comp-001",
-                "fusionModelPath": "test.f3d",
-                "parameters": {}
-            }
-        ]
-    }
+    return copy.deepcopy(_MINIMAL_ORDER_TEMPLATE)
 
 
 class TestValidatorInit:
@@ -70,7 +126,7 @@ class TestValidatorInit:
     def test_init_custom_schema(self, tmp_path):
         """Test validator with custom schema path"""
         schema_file = tmp_path / "test_schema.json"
-        schema_file.write_text(json.dumps({
+        schema_file.write_bytes(_dumps({
             "$schema": "http://json-schema.org/draft-07/schema#",
             "title": "TestSchema"
         }))
@@ -78,94 +134,198 @@ class TestValidatorInit:
         validator = OrderValidator(str(schema_file))
         assert validator.schema['title'] == "TestSchema"
     
+    def test_init_in_memory_schema(self):
+        """Test validator with an already-parsed schema"""
+        schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "title": "TestSchema",
+            "version": "9.9.9"
+        }
+        validator = OrderValidator(schema=schema)
+        assert validator.schema_path is None
+        assert validator.schema == schema
+        assert validator.get_schema_version() == "9.9.9"
+        assert OrderValidator().get_schema_version() != "9.9.9"
+    
+    def test_schema_cached_until_modified(self, tmp_path):
+        """Test schema is parsed once and reloaded after the file changes"""
+        schema_file = tmp_path / "test_schema.json"
+        schema_file.write_bytes(_dumps({"title": "First"}))
+        
+        first = OrderValidator(str(schema_file))
+        second = OrderValidator(str(schema_file))
+        assert first.schema is second.schema
+        
+        schema_file.write_bytes(_dumps({"title": "Second"}))
+        stat = schema_file.stat()
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert OrderValidator(str(schema_file)).schema['title'] == "Second"
+    
+    def test_schema_read_only(self):
+        """Test the shared schema can't be modified at any level"""
+        schema = OrderValidator().schema
+        with pytest.raises(TypeError):
+            schema['title'] = "Changed"
+        with pytest.raises(TypeError):
+            schema['properties']['orderId']['minLength'] = 0
+        # Arrays are tuples
+        assert isinstance(schema['required'], tuple)
+    
+    def test_schema_loaded_lazily(self, tmp_path):
+        """Test schema file is only parsed on first use"""
+        schema_file = tmp_path / "bad_schema.json"
+        schema_file.write_text("{invalid json")
+        
+        validator = OrderValidator(str(schema_file))
+        with pytest.raises(ValidationError, match="Invalid JSON in schema file"):
+            validator.schema
+    
     def test_init_missing_schema(self):
         """Test validator fails with missing schema"""
         with pytest.raises(ValidationError, match="Schema file not found"):
             OrderValidator("/nonexistent/schema.json")
 
 
-class TestBasicValidation:
-    """Test basic order validation"""
+class TestSchemaOracle:
+    """Test schema.json agrees with the validator's rules (jsonschema used as a test-side oracle)"""
     
-    def test_valid_order(self, validator, valid_order):
-        """Test validation passes for valid order"""
-        is_valid, errors = validator.validate_order(valid_order)
-        assert is_valid
-        assert len(errors) == 0
-    
-    def test_minimal_order(self, validator, minimal_order):
-        """Test validation passes for minimal order"""
-        is_valid, errors = validator.validate_order(minimal_order)
-        assert is_valid
-        assert len(errors) == 0
+    def test_valid_orders_pass_schema(self, compiled_validator, valid_order, minimal_order):
+        """Test orders the validator accepts also pass schema.json"""
+        assert compiled_validator.is_valid(valid_order)
+        assert compiled_validator.is_valid(minimal_order)
     
-    def test_not_dict(self, validator):
-        """Test validation fails for non-dict input"""
-        is_valid, errors = validator.validate_order([])
-        assert not is_valid
-        assert "Order must be a JSON object" in errors
+    def test_invalid_order_fails_schema(self, compiled_validator, valid_order):
+        """Test schema.json rejects an order the validator rejects"""
+        valid_order['components'][0]['fusionModelPath'] = ""
+        assert not compiled_validator.is_valid(valid_order)
+    
+    @pytest.mark.parametrize("order, expected_code", [
+        ({}, "version.missing"),
+        ({"version": "1.0.0", "orderId": "X", "components": 5}, "components.not_array"),
+        ({"version": "1.0.0", "orderId": "X", "components": []}, "components.min_items"),
+    ])
+    def test_custom_schema_does_not_loosen_rules(self, tmp_path, order, expected_code):
+        """Test a lax custom schema can't make the validator accept invalid orders"""
+        schema_file = tmp_path / "lax_schema.json"
+        schema_file.write_bytes(_dumps({"title": "Lax"}))
+        
+        for validator in (OrderValidator(str(schema_file)), OrderValidator(schema={"title": "Lax"})):
+            is_valid, errors = validator.validate_order(order)
+            assert not is_valid
+            assert has_error(errors, expected_code)
+
+
+# (case id, order document) validated together by TestBasicValidation
+_BASIC_CASES = [
+    ("valid", _VALID_ORDER_TEMPLATE),
+    ("minimal", _MINIMAL_ORDER_TEMPLATE),
+    ("not_dict", []),
+    ("empty", {}),
+]
+
+
+def _run_batch(validator, docs):
+    """Validate several documents in one pass, returning (is_valid, errors) per document"""
+    return [validator.validate_order(doc) for doc in docs]
+
+
+@pytest.fixture(scope="module")
+def basic_results(validator):
+    """Results for every basic case, keyed by case id"""
+    case_ids, docs = zip(*_BASIC_CASES)
+    return dict(zip(case_ids, _run_batch(validator, docs)))
+
+
+class TestBasicValidation:
+    """Test basic order validation"""
     
-    def test_empty_order(self, validator):
-        """Test validation fails for empty order"""
-        is_valid, errors = validator.validate_order({})
-        assert not is_valid
-        assert any("version" in error for error in errors)
-        assert any("orderId" in error for error in errors)
-        assert any("components" in error for error in errors)
+    @pytest.mark.parametrize("case, expected_valid, expected_errors", [
+        ("valid", True, []),
+        ("minimal", True, []),
+        ("not_dict", False, ["order.not_object"]),
+        ("empty", False, ["version.missing", "orderId.missing", "components.missing"]),
+    ])
+    def test_basic_case(self, basic_results, case, expected_valid, expected_errors):
+        """Test valid, minimal, non-dict and empty orders"""
+        is_valid, errors = basic_results[case]
+        assert is_valid == expected_valid
+        if expected_valid:
+            assert len(errors) == 0
+        for code in expected_errors:
+            assert has_error(errors, code), f"No {code!r} error: {errors}"
 
 
 class TestVersionValidation:
     """Test version field validation"""
     
-    def test_valid_version(self, validator, valid_order):
+    @pytest.mark.parametrize("version", ["1.0.0", "0.0.1", "10.20.30"])
+    def test_valid_version(self, validator, valid_order, version):
         """Test various valid version formats"""
-        valid_versions = ["1.0.0", "0.0.1", "10.20.30"]
-        for version in valid_versions:
-            valid_order['version'] = version
-            is_valid, errors = validator.validate_order(valid_order)
-            assert is_valid, f"Version {version} should be valid"
+        valid_order['version'] = version
+        is_valid, errors = validator.validate_order(valid_order)
+        assert is_valid, f"Version {version} should be valid"
     
-    def test_invalid_version_format(self, validator, valid_order):
+    @pytest.mark.parametrize("version", ["1.0", "1", "v1.0.0", "1.0.0-beta", ""])
+    def test_invalid_version_format(self, validator, valid_order, version):
         """Test invalid version formats"""
-        invalid_versions = ["1.0", "1", "v1.0.0", "1.0.0-beta", ""]
-        for version in invalid_versions:
-            valid_order['version'] = version
-            is_valid, errors = validator.validate_order(valid_order)
-            assert not is_valid
-            assert any("version" in error.lower() for error in errors)
+        valid_order['version'] = version
+        is_valid, errors = validator.validate_order(valid_order)
+        assert not is_valid
+        assert has_error(errors, "version.format")
+    
+    def test_version_trailing_newline(self, validator, valid_order):
+        """Test version rejected even though the schema pattern allows a trailing newline"""
+        valid_order['version'] = "1.0.0\n"
+        is_valid, errors = validator.validate_order(valid_order)
+        assert not is_valid
+        assert has_error(errors, "version.format")
+    
+    def test_version_regex_compiled_once(self, validator, valid_order, monkeypatch):
+        """Test version checks reuse the module's precompiled pattern"""
+        import validator as validator_module
+        assert isinstance(validator_module._VERSION_RE, re.Pattern)
+        
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("version pattern recompiled during validation")
+        monkeypatch.setattr(validator_module.re, "compile", fail_compile)
+        
+        valid_order['version'] = "2.0.0"
+        assert validator.validate_order(valid_order) == (True, [])
+        valid_order['version'] = "2.0"
+        assert not validator.validate_order(valid_order)[0]
     
     def test_missing_version(self, validator, valid_order):
         """Test missing version field"""
         del valid_order['version']
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("version" in error for error in errors)
+        assert has_error(errors, "version.missing")
 
 
 class TestOrderIdValidation:
     """Test orderId field validation"""
     
-    def test_valid_order_id(self, validator, valid_order):
+    @pytest.mark.parametrize("order_id", ["ORDER-001", "ABC123", "test-order-2025"])
+    def test_valid_order_id(self, validator, valid_order, order_id):
         """Test various valid order IDs"""
-        valid_ids = ["ORDER-001", "ABC123", "test-order-2025"]
-        for order_id in valid_ids:
-            valid_order['orderId'] = order_id
-            is_valid, errors = validator.validate_order(valid_order)
-            assert is_valid
+        valid_order['orderId'] = order_id
+        is_valid, errors = validator.validate_order(valid_order)
+        assert is_valid
     
     def test_empty_order_id(self, validator, valid_order):
         """Test empty orderId"""
         valid_order['orderId'] = ""
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("orderId" in error for error in errors)
+        assert has_error(errors, "orderId.empty")
     
     def test_missing_order_id(self, validator, valid_order):
         """Test missing orderId"""
         del valid_order['orderId']
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("orderId" in error for error in errors)
+        assert has_error(errors, "orderId.missing")
 
 
 class TestComponentsValidation:
@@ -186,14 +346,14 @@ class TestComponentsValidation:
         valid_order['components'] = []
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("at least 1 item" in error for error in errors)
+        assert has_error(errors, "components.min_items")
     
     def test_components_not_array(self, validator, valid_order):
         """Test validation fails when components is not array"""
         valid_order['components'] = {}
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("array" in error.lower() for error in errors)
+        assert has_error(errors, "components.not_array")
     
     def test_duplicate_component_ids(self, validator, valid_order):
         """Test validation fails for duplicate componentIds"""
@@ -204,46 +364,52 @@ class TestComponentsValidation:
         })
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("Duplicate componentId" in error for error in errors)
+        assert has_error(errors, "componentId.duplicate")
+
+    @pytest.mark.parametrize("count", [10, 1000])
+    def test_duplicate_component_ids_large_order(self, validator, valid_order, count):
+        """Test a duplicate is reported once however many components the order has"""
+        valid_order['components'] = [
+            {"componentId": f"comp-{i:04d}", "fusionModelPath": "test.f3d", "parameters": {}}
+            for i in range(count)
+        ]
+        valid_order['components'][-1]['componentId'] = "comp-0000"
+        is_valid, errors = validator.validate_order(valid_order)
+        assert not is_valid
+        assert len(errors) == 1
+        assert has_error(errors, "componentId.duplicate")
+
+
+def _set_field(field, value):
+    """Mutation setting a field of the first component"""
+    def mutate(order):
+        order['components'][0][field] = value
+    return mutate
+
+
+def _del_field(field):
+    """Mutation removing a field from the first component"""
+    def mutate(order):
+        del order['components'][0][field]
+    return mutate
 
 
 class TestComponentFieldValidation:
     """Test individual component field validation"""
     
-    def test_missing_component_id(self, validator, valid_order):
-        """Test component without componentId"""
-        del valid_order['components'][0]['componentId']
-        is_valid, errors = validator.validate_order(valid_order)
-        assert not is_valid
-        assert any("componentId" in error for error in errors)
-    
-    def test_missing_fusion_model_path(self, validator, valid_order):
-        """Test component without fusionModelPath"""
-        del valid_order['components'][0]['fusionModelPath']
-        is_valid, errors = validator.validate_order(valid_order)
-        assert not is_valid
-        assert any("fusionModelPath" in error for error in errors)
-    
-    def test_missing_parameters(self, validator, valid_order):
-        """Test component without parameters"""
-        del valid_order['components'][0]['parameters']
-        is_valid, errors = validator.validate_order(valid_order)
-        assert not is_valid
-        assert any("parameters" in error for error in errors)
-    
-    def test_empty_component_id(self, validator, valid_order):
-        """Test component with empty componentId"""
-        valid_order['components'][0]['componentId'] = ""
+    @pytest.mark.parametrize("mutate, expected", [
+        pytest.param(_del_field('componentId'), "component.componentId.missing", id="missing_component_id"),
+        pytest.param(_del_field('fusionModelPath'), "component.fusionModelPath.missing", id="missing_fusion_model_path"),
+        pytest.param(_del_field('parameters'), "component.parameters.missing", id="missing_parameters"),
+        pytest.param(_set_field('componentId', ""), "component.componentId.invalid", id="empty_component_id"),
+        pytest.param(_set_field('fusionModelPath', ""), "component.fusionModelPath.invalid", id="empty_fusion_model_path"),
+    ])
+    def test_component_field_error(self, validator, valid_order, mutate, expected):
+        """Test a missing or empty component field is reported"""
+        mutate(valid_order)
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("componentId" in error for error in errors)
-    
-    def test_empty_fusion_model_path(self, validator, valid_order):
-        """Test component with empty fusionModelPath"""
-        valid_order['components'][0]['fusionModelPath'] = ""
-        is_valid, errors = validator.validate_order(valid_order)
-        assert not is_valid
-        assert any("fusionModelPath" in error for error in errors)
+        assert has_error(errors, expected)
 
 
 class TestParameterValidation:
@@ -283,7 +449,7 @@ class TestParameterValidation:
         valid_order['components'][0]['parameters'] = []
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("parameters must be an object" in error for error in errors)
+        assert has_error(errors, "component.parameters.not_object")
     
     def test_invalid_parameter_type(self, validator, valid_order):
         """Test validation fails for invalid parameter types"""
@@ -292,7 +458,7 @@ class TestParameterValidation:
         }
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("Invalid value type" in error for error in errors)
+        assert has_error(errors, "parameters.value_type")
 
 
 class TestOptionalFields:
@@ -327,7 +493,7 @@ class TestOptionalFields:
         valid_order['components'][0]['setupNames'] = [1, 2, 3]
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("setupNames" in error for error in errors)
+        assert has_error(errors, "component.setupNames.not_strings")
     
     def test_post_processor_config(self, validator, valid_order):
         """Test with postProcessorConfig"""
@@ -376,45 +542,110 @@ class TestOutputConfig:
         }
         is_valid, errors = validator.validate_order(valid_order)
         assert not is_valid
-        assert any("includeTimestamp" in error for error in errors)
+        assert has_error(errors, "outputConfig.includeTimestamp.type")
+
+
+class TestErrorCodes:
+    """Test the error code table covers every message the validator produces"""
+    
+    def test_every_error_has_code(self, validator, valid_order):
+        """Test each message from a badly broken order maps to a code"""
+        valid_order['version'] = "1.0\n"
+        valid_order['orderId'] = ""
+        valid_order['components'] = [
+            "not an object",
+            {"fusionModelPath": "", "parameters": {"bad": None}, "setupNames": [1],
+             "postProcessorConfig": []},
+            {"componentId": "dup", "fusionModelPath": "a.f3d", "parameters": [], "setupNames": {}},
+            {"componentId": "dup", "fusionModelPath": "b.f3d", "parameters": {"": 1}},
+        ]
+        valid_order['outputConfig'] = {"baseDirectory": 1, "includeTimestamp": "yes"}
+        is_valid, errors = validator.validate_order(valid_order)
+        assert not is_valid
+        assert error_codes(errors) == {
+            "version.format", "orderId.empty", "component.not_object",
+            "component.componentId.missing", "component.componentId.invalid",
+            "component.fusionModelPath.invalid", "parameters.value_type",
+            "component.setupNames.not_strings", "component.postProcessorConfig.not_object",
+            "component.parameters.not_object", "component.setupNames.not_array",
+            "parameters.name_invalid", "componentId.duplicate",
+            "outputConfig.baseDirectory.type", "outputConfig.includeTimestamp.type",
+        }
 
 
 class TestFileValidation:
     """Test file-based validation"""
     
-    def test_validate_sample_file(self, validator):
+    def test_validate_sample_file(self, sample_path, json_backend):
         """Test validation of sample order file"""
-        sample_path = Path(__file__).parent.parent / "samples" / "sample_order.json"
-        if sample_path.exists():
-            is_valid, errors = validator.validate_json_file(str(sample_path))
-            assert is_valid, f"Sample file should be valid. Errors: {errors}"
+        # Own instance so the shared validator's result cache doesn't skip parsing
+        is_valid, errors = OrderValidator().validate_json_file(str(sample_path))
+        assert is_valid, f"Sample file should be valid. Errors: {errors}"
+    
+    def test_validate_file_result_cached(self, valid_order, tmp_path):
+        """Test repeat validation of identical content reuses the result"""
+        # Own instance so the shared validator's cache doesn't affect the counts
+        validator = OrderValidator()
+        order_file = tmp_path / "order.json"
+        order_file.write_bytes(_dumps(valid_order))
+        assert validator.validate_json_file(str(order_file)) == (True, [])
+        assert len(validator._result_cache) == 1
+        
+        # Same content in another file hits the cache
+        copy_file = tmp_path / "copy.json"
+        copy_file.write_bytes(_dumps(valid_order))
+        assert validator.validate_json_file(str(copy_file)) == (True, [])
+        assert len(validator._result_cache) == 1
+        
+        # Changed content is validated again
+        valid_order['components'] = []
+        order_file.write_bytes(_dumps(valid_order))
+        is_valid, errors = validator.validate_json_file(str(order_file))
+        assert not is_valid
+        assert has_error(errors, "components.min_items")
     
     def test_validate_nonexistent_file(self, validator):
         """Test validation of non-existent file"""
         is_valid, errors = validator.validate_json_file("/nonexistent/file.json")
         assert not is_valid
-        assert any("not found" in error for error in errors)
+        assert has_error(errors, "file.not_found")
     
-    def test_validate_invalid_json_syntax(self, validator, tmp_path):
+    def test_validate_invalid_json_syntax(self, validator, tmp_path, json_backend):
         """Test validation of file with invalid JSON syntax"""
         bad_file = tmp_path / "bad.json"
         bad_file.write_text("{invalid json")
         
         is_valid, errors = validator.validate_json_file(str(bad_file))
         assert not is_valid
-        assert any("Invalid JSON" in error for error in errors)
+        assert has_error(errors, "file.invalid_json")
+    
+    def test_validate_in_memory_content(self, valid_order, json_backend):
+        """Test validation of order content passed as bytes or a binary file object"""
+        # Own instance so the shared validator's result cache doesn't skip parsing
+        validator = OrderValidator()
+        assert validator.validate_json_file(_dumps(valid_order)) == (True, [])
+        
+        is_valid, errors = validator.validate_json_file(io.BytesIO(b"{invalid json"))
+        assert not is_valid
+        assert has_error(errors, "file.invalid_json")
 
 
 class TestConvenienceFunction:
     """Test convenience function"""
     
-    def test_validate_order_file_function(self):
+    def test_validate_order_file_function(self, sample_path):
         """Test standalone validate_order_file function"""
-        sample_path = Path(__file__).parent.parent / "samples" / "sample_order.json"
-        if sample_path.exists():
-            is_valid, errors = validate_order_file(str(sample_path))
-            assert is_valid
-
+        is_valid, errors = validate_order_file(str(sample_path))
+        assert is_valid
+    
+    def test_validate_order_file_reuses_validator(self, valid_order, tmp_path, monkeypatch):
+        """Test repeat calls share one validator, so identical content hits its result cache"""
+        order_file = tmp_path / "order.json"
+        order_file.write_bytes(_dumps(valid_order))
+        assert validate_order_file(str(order_file)) == (True, [])
+        
+        def fail_validate(*args, **kwargs):
+            raise AssertionError("order validated again")
+        monkeypatch.setattr(OrderValidator, "validate_order", fail_validate)
+        assert validate_order_file(str(order_file)) == (True, [])
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
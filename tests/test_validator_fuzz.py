@@ -0,0 +1,42 @@
+"""
+Schema-driven fuzz tests for the order validator
+
+Orders are generated from schema.json with hypothesis-jsonschema; the module
+is skipped when it isn't installed.
+
+Run with: python -m pytest tests/test_validator_fuzz.py -v
+"""
+
+import json
+import re
+import pytest
+from pathlib import Path
+
+pytest.importorskip("hypothesis_jsonschema")
+
+from hypothesis import HealthCheck, given, settings
+from hypothesis_jsonschema import from_schema
+
+from validator import OrderValidator
+
+_SCHEMA = json.loads((Path(__file__).parent.parent / "schema.json").read_bytes())
+
+# Shared by every example - the schema is only read if a test asks for it
+_VALIDATOR = OrderValidator()
+
+
+@pytest.mark.slow
+@settings(max_examples=50, deadline=None, suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much])
+@given(order=from_schema(_SCHEMA))
+def test_schema_valid_orders_accepted(order):
+    """Test orders that pass schema.json are accepted unless they break a rule the schema can't express"""
+    # schema.json can't require unique componentIds, and its version pattern
+    # lets a trailing newline through
+    comp_ids = [component['componentId'] for component in order['components']]
+    expected_valid = (
+        len(set(comp_ids)) == len(comp_ids)
+        and re.fullmatch(r'\d+\.\d+\.\d+', order['version']) is not None
+    )
+
+    is_valid, errors = _VALIDATOR.validate_order(order)
+    assert is_valid == expected_valid, errors